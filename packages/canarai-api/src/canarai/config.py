@@ -1,8 +1,9 @@
 """Application configuration via environment variables."""
 
-from functools import lru_cache
+from functools import cache, cached_property
 from typing import ClassVar
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +11,10 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables and .env file."""
 
     database_url: str = "sqlite+aiosqlite:///./canarai.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
+    db_echo: bool = False
     api_secret_key: str = "change-me"
     api_host: str = "0.0.0.0"
     api_port: int = 8787
@@ -17,22 +22,41 @@ class Settings(BaseSettings):
     environment: str = "development"
     webhook_timeout_seconds: int = 10
     webhook_max_retries: int = 3
+    webhook_workers: int = 8
+    webhook_queue_size: int = 1000
     script_base_url: str = "http://localhost:8787"
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
-    INSECURE_SECRETS: ClassVar[set[str]] = {"change-me", "change-me-in-production", "secret", ""}
+    INSECURE_SECRETS: ClassVar[frozenset[str]] = frozenset(
+        {"change-me", "change-me-in-production", "secret", ""}
+    )
+
+    _production_validated: bool = PrivateAttr(default=False)
+
+    @cached_property
+    def cors_origin_list(self) -> tuple[str, ...]:
+        """Parsed CORS origins, computed once per settings instance."""
+        if self.cors_origins.strip() == "*":
+            return ("*",)
+        return tuple(o.strip() for o in self.cors_origins.split(",") if o.strip())
 
     def validate_production(self) -> None:
-        """Raise if running in production with an insecure default secret key."""
+        """Raise if running in production with an insecure default secret key.
+
+        A no-op once a check has passed for this settings instance.
+        """
+        if self._production_validated:
+            return
         if self.environment == "production" and self.api_secret_key in self.INSECURE_SECRETS:
             raise RuntimeError(
                 "API_SECRET_KEY must be changed from default in production. "
                 'Generate one: python -c "import secrets; print(secrets.token_hex(32))"'
             )
+        self._production_validated = True
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Return cached settings singleton."""
     return Settings()
@@ -2,6 +2,8 @@
 
 from collections.abc import AsyncGenerator
 
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -10,10 +12,18 @@ from sqlalchemy.ext.asyncio import (
 
 from canarai.config import get_settings
 
+# Shared liveness query, reused so the compiled form stays cached
+HEALTH_PING = text("SELECT 1")
+
 _engine = None
 _session_factory = None
 
 
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB bind values with orjson; the driver expects ``str``."""
+    return orjson.dumps(value).decode()
+
+
 def _get_engine():
     """Create or return the cached async engine."""
     global _engine
@@ -22,13 +32,28 @@ def _get_engine():
         url = settings.database_url
 
         connect_args = {}
+        pool_args = {}
         if url.startswith("sqlite"):
             connect_args["check_same_thread"] = False
+        else:
+            # Size the pool for concurrent async request handling
+            pool_args = {
+                "pool_size": settings.db_pool_size,
+                "max_overflow": settings.db_max_overflow,
+                "pool_pre_ping": True,
+                "pool_recycle": settings.db_pool_recycle_seconds,
+                "pool_use_lifo": True,
+            }
 
         _engine = create_async_engine(
             url,
-            echo=(settings.environment == "development"),
+            echo=settings.db_echo,
+            # Native JSONB columns on PostgreSQL are (de)serialized by the
+            # dialect, so route that through orjson as well
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
             connect_args=connect_args,
+            **pool_args,
         )
     return _engine
 
@@ -54,13 +79,33 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def ping(session: AsyncSession) -> None:
+    """Run a trivial query to confirm the database is reachable."""
+    await session.execute(HEALTH_PING)
+
+
+async def warmup_db() -> None:
+    """Build the engine and session factory and open one pooled connection.
+
+    Called from the app lifespan so the first request does not pay for
+    engine creation, driver import, or the initial connect.
+    """
+    factory = _get_session_factory()
+    async with factory() as session:
+        await ping(session)
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Yield an async database session for FastAPI dependency injection."""
+    """Yield an async database session for FastAPI dependency injection.
+
+    The session is not committed on exit; endpoints that write must call
+    ``await session.commit()`` themselves, so read-only requests skip the
+    commit round-trip.
+    """
     factory = _get_session_factory()
     async with factory() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
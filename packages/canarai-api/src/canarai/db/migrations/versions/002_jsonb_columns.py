@@ -0,0 +1,56 @@
+"""Convert JSON text columns to native JSONB on PostgreSQL.
+
+Revision ID: 002_jsonb_columns
+Revises: 001_initial
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "002_jsonb_columns"
+down_revision: str | None = "001_initial"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column) pairs backed by JSONType
+JSON_COLUMNS = [
+    ("sites", "config"),
+    ("visits", "detection"),
+    ("test_results", "evidence"),
+    ("webhooks", "events"),
+    ("webhook_deliveries", "payload"),
+]
+
+
+def upgrade() -> None:
+    # SQLite keeps storing JSON as TEXT
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            postgresql_using=f"{column}::text",
+            existing_nullable=False,
+        )
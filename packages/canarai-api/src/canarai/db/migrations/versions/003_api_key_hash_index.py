@@ -0,0 +1,49 @@
+"""Add a partial index on active API key hashes.
+
+Revision ID: 003_api_key_hash_index
+Revises: 002_jsonb_columns
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "003_api_key_hash_index"
+down_revision: str | None = "002_jsonb_columns"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_api_keys_key_hash_active",
+                "api_keys",
+                ["key_hash"],
+                postgresql_where=sa.text("is_active IS true"),
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(
+            "ix_api_keys_key_hash_active",
+            "api_keys",
+            ["key_hash"],
+            sqlite_where=sa.text("is_active IS 1"),
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_api_keys_key_hash_active",
+                table_name="api_keys",
+                postgresql_concurrently=True,
+            )
+    else:
+        op.drop_index("ix_api_keys_key_hash_active", table_name="api_keys")
@@ -0,0 +1,97 @@
+"""Store API key hashes as raw SHA-256 bytes instead of hex.
+
+Revision ID: 004_api_key_hash_bytes
+Revises: 003_api_key_hash_index
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "004_api_key_hash_bytes"
+down_revision: str | None = "003_api_key_hash_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _drop_hash_index() -> None:
+    op.drop_index("ix_api_keys_key_hash_active", table_name="api_keys")
+
+
+def _create_hash_index() -> None:
+    op.create_index(
+        "ix_api_keys_key_hash_active",
+        "api_keys",
+        ["key_hash"],
+        postgresql_where=sa.text("is_active IS true"),
+        sqlite_where=sa.text("is_active IS 1"),
+    )
+
+
+def _convert_rows(convert) -> None:
+    """Rewrite every key_hash value in Python (SQLite has no hex decode)."""
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, key_hash FROM api_keys")).all()
+    for row_id, key_hash in rows:
+        bind.execute(
+            sa.text("UPDATE api_keys SET key_hash = :key_hash WHERE id = :id"),
+            {"key_hash": convert(key_hash), "id": row_id},
+        )
+
+
+def _hex_to_digest(value: str | bytes) -> bytes:
+    if isinstance(value, bytes):
+        value = value.decode("ascii")
+    return bytes.fromhex(value)
+
+
+def upgrade() -> None:
+    _drop_hash_index()
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "api_keys",
+            "key_hash",
+            type_=sa.LargeBinary(32),
+            postgresql_using="decode(key_hash, 'hex')",
+            existing_nullable=False,
+        )
+    else:
+        with op.batch_alter_table("api_keys") as batch_op:
+            batch_op.alter_column(
+                "key_hash",
+                type_=sa.LargeBinary(32),
+                existing_type=sa.String(128),
+                existing_nullable=False,
+            )
+        # The batch copy CASTs the hex text to BLOB; decode it to the digest
+        _convert_rows(_hex_to_digest)
+
+    _create_hash_index()
+
+
+def downgrade() -> None:
+    _drop_hash_index()
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "api_keys",
+            "key_hash",
+            type_=sa.String(128),
+            postgresql_using="encode(key_hash, 'hex')",
+            existing_nullable=False,
+        )
+    else:
+        _convert_rows(lambda v: v.hex() if isinstance(v, bytes) else v)
+        with op.batch_alter_table("api_keys") as batch_op:
+            batch_op.alter_column(
+                "key_hash",
+                type_=sa.String(128),
+                existing_type=sa.LargeBinary(32),
+                existing_nullable=False,
+            )
+
+    _create_hash_index()
@@ -0,0 +1,49 @@
+"""Add a partial index on enabled webhooks per site.
+
+Revision ID: 005_webhooks_enabled_index
+Revises: 004_api_key_hash_bytes
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "005_webhooks_enabled_index"
+down_revision: str | None = "004_api_key_hash_bytes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_webhooks_site_id_enabled",
+                "webhooks",
+                ["site_id"],
+                postgresql_where=sa.text("enabled IS true"),
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(
+            "ix_webhooks_site_id_enabled",
+            "webhooks",
+            ["site_id"],
+            sqlite_where=sa.text("enabled IS 1"),
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_webhooks_site_id_enabled",
+                table_name="webhooks",
+                postgresql_concurrently=True,
+            )
+    else:
+        op.drop_index("ix_webhooks_site_id_enabled", table_name="webhooks")
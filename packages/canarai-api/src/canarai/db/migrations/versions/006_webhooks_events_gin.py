@@ -0,0 +1,44 @@
+"""Add a GIN index on webhook event subscriptions (PostgreSQL only).
+
+Revision ID: 006_webhooks_events_gin
+Revises: 005_webhooks_enabled_index
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "006_webhooks_events_gin"
+down_revision: str | None = "005_webhooks_enabled_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # SQLite stores events as JSON text and filters them in Python
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_webhooks_events_gin",
+            "webhooks",
+            ["events"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_webhooks_events_gin",
+            table_name="webhooks",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,97 @@
+"""Add covering indexes for the results summary aggregation.
+
+Replaces the single-column test_results.visit_id index with one on
+(visit_id, outcome, score), and on PostgreSQL rebuilds the visits
+(site_id, timestamp) index with INCLUDE columns.
+
+Revision ID: 007_summary_covering_indexes
+Revises: 006_webhooks_events_gin
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "007_summary_covering_indexes"
+down_revision: str | None = "006_webhooks_events_gin"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+VISITS_INCLUDE = ["visit_id", "classification", "agent_family"]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index(
+            "ix_test_results_visit_id_outcome_score",
+            "test_results",
+            ["visit_id", "outcome", "score"],
+        )
+        op.drop_index("ix_test_results_visit_id", table_name="test_results")
+        return
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_test_results_visit_id_outcome_score",
+            "test_results",
+            ["visit_id", "outcome", "score"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_test_results_visit_id",
+            table_name="test_results",
+            postgresql_concurrently=True,
+        )
+        # Build the covering index alongside the old one, then swap names
+        op.create_index(
+            "ix_visits_site_id_timestamp_covering",
+            "visits",
+            ["site_id", "timestamp"],
+            postgresql_include=VISITS_INCLUDE,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_visits_site_id_timestamp",
+            table_name="visits",
+            postgresql_concurrently=True,
+        )
+        op.execute(
+            "ALTER INDEX ix_visits_site_id_timestamp_covering RENAME TO ix_visits_site_id_timestamp"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index("ix_test_results_visit_id", "test_results", ["visit_id"])
+        op.drop_index("ix_test_results_visit_id_outcome_score", table_name="test_results")
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_test_results_visit_id",
+            "test_results",
+            ["visit_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_test_results_visit_id_outcome_score",
+            table_name="test_results",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_visits_site_id_timestamp_plain",
+            "visits",
+            ["site_id", "timestamp"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_visits_site_id_timestamp",
+            table_name="visits",
+            postgresql_concurrently=True,
+        )
+        op.execute(
+            "ALTER INDEX ix_visits_site_id_timestamp_plain RENAME TO ix_visits_site_id_timestamp"
+        )
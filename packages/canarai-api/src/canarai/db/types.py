@@ -1,26 +1,34 @@
 """Custom SQLAlchemy column types."""
 
-import json
-
+import orjson
 from sqlalchemy import Text, TypeDecorator
+from sqlalchemy.dialects import postgresql
+
+_dumps = orjson.dumps
+_loads = orjson.loads
 
 
 class JSONType(TypeDecorator):
     """Platform-agnostic JSON column type.
 
-    Uses native JSON on PostgreSQL, stores as TEXT with json
-    serialization on SQLite.
+    Uses native JSONB on PostgreSQL (encoded by the engine's orjson
+    json_serializer), stores as TEXT with orjson serialization on SQLite.
     """
 
     impl = Text
     cache_ok = True
 
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.JSONB())
+        return dialect.type_descriptor(Text())
+
     def process_bind_param(self, value, dialect):
-        if value is not None:
-            return json.dumps(value)
-        return None
+        if value is None or dialect.name == "postgresql":
+            return value
+        return _dumps(value).decode()
 
     def process_result_value(self, value, dialect):
-        if value is not None:
-            return json.loads(value)
-        return None
+        if value is None or dialect.name == "postgresql":
+            return value
+        return _loads(value)
@@ -3,9 +3,14 @@
 import hashlib
 import hmac
 from collections.abc import AsyncGenerator
-
-from fastapi import Depends, Header, HTTPException, status
-from sqlalchemy import select
+from functools import lru_cache
+from typing import TypeVar
+
+from cachetools import TTLCache
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from canarai.config import Settings, get_settings
@@ -13,6 +18,27 @@ from canarai.db.engine import get_session
 from canarai.models.api_key import ApiKey
 from canarai.models.site import Site
 
+_BEARER_SCHEME = "Bearer"
+
+T = TypeVar("T")
+
+# Auth lookups built once and reused with bound parameters
+_API_KEY_STMT = (
+    select(ApiKey)
+    .where(ApiKey.key_hash == bindparam("key_hash"))
+    .where(ApiKey.is_active.is_(True))
+)
+_SITE_STMT = (
+    select(Site)
+    .where(Site.site_key == bindparam("site_key"))
+    .where(Site.is_active.is_(True))
+)
+
+# Short-lived caches of resolved (detached) auth rows, keyed by key hash / site key
+AUTH_CACHE_TTL = 30  # seconds
+_api_key_cache: TTLCache[bytes, ApiKey] = TTLCache(maxsize=2048, ttl=AUTH_CACHE_TTL)
+_site_cache: TTLCache[str, Site] = TTLCache(maxsize=2048, ttl=AUTH_CACHE_TTL)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session."""
@@ -20,46 +46,126 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def _inline_schema(schema: dict) -> dict:
+    """Resolve local ``$defs`` references so a model schema stands alone.
+
+    Bodies declared through ``openapi_extra`` cannot use refs to
+    ``#/$defs/...``, which would not resolve against the OpenAPI document root.
+    """
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None:
+                return resolve(defs[ref.rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+def json_body_openapi(adapter: TypeAdapter) -> dict:
+    """Return ``openapi_extra`` documenting a body read with :func:`validate_json_body`."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": _inline_schema(adapter.json_schema())}
+            },
+        }
+    }
+
+
+def _is_json_content_type(content_type: str | None) -> bool:
+    """Return whether ``content_type`` is application/json or a ``+json`` type."""
+    if not content_type:
+        return False
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type == "application/json" or (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    )
+
+
+async def validate_json_body(request: Request, adapter: TypeAdapter[T]) -> T:
+    """Parse and validate the raw request body in one pass with ``adapter``.
+
+    pydantic-core reads the bytes directly, skipping Starlette's separate
+    JSON decode. Errors are reported like FastAPI's own body validation.
+    Like FastAPI, only JSON content types are accepted, so "simple"
+    cross-origin form or text/plain POSTs are rejected. The ingest
+    endpoint's text/plain bodies are rewritten to application/json by
+    ``CanaraiMiddleware`` before they get here.
+    """
+    if not _is_json_content_type(request.headers.get("content-type")):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Content-Type must be application/json",
+        )
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]
+        ) from None
+
+
 def get_app_settings() -> Settings:
     """Return application settings."""
     return get_settings()
 
 
-def _hash_key(raw_key: str) -> str:
-    """Hash an API key with SHA-256."""
-    return hashlib.sha256(raw_key.encode()).hexdigest()
+def hash_api_key(raw_key: str) -> bytes:
+    """Hash an API key with SHA-256, returning the raw digest stored in key_hash."""
+    return hashlib.sha256(raw_key.encode()).digest()
 
 
-async def verify_api_key(
-    authorization: str = Header(..., description="Bearer <api_key>"),
-    db: AsyncSession = Depends(get_db),
-) -> ApiKey:
-    """Verify Bearer token auth for management endpoints.
+# Memoized for the auth path so repeat requests with the same bearer token
+# skip rehashing; key creation calls hash_api_key directly.
+_hash_key = lru_cache(maxsize=4096)(hash_api_key)
 
-    Extracts the API key from the Authorization header, hashes it,
-    and looks up the matching active key in the database.
-    """
-    if not authorization.startswith("Bearer "):
+
+def _extract_bearer(authorization: str) -> str:
+    """Return the token from a ``Bearer <token>`` Authorization header."""
+    scheme, sep, raw_key = authorization.partition(" ")
+    if scheme != _BEARER_SCHEME or not sep:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization header must use Bearer scheme",
         )
 
-    raw_key = authorization[7:].strip()
+    raw_key = raw_key.strip()
     if not raw_key:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="API key is required",
         )
+    return raw_key
+
+
+async def verify_api_key(
+    authorization: str = Header(..., description="Bearer <api_key>"),
+    db: AsyncSession = Depends(get_db),
+) -> ApiKey:
+    """Verify Bearer token auth for management endpoints.
 
+    Extracts the API key from the Authorization header, hashes it,
+    and looks up the matching active key in the database.
+    """
+    raw_key = _extract_bearer(authorization)
     key_hash = _hash_key(raw_key)
-    stmt = (
-        select(ApiKey)
-        .where(ApiKey.key_hash == key_hash)
-        .where(ApiKey.is_active.is_(True))
-    )
-    result = await db.execute(stmt)
-    api_key = result.scalar_one_or_none()
+    api_key = _api_key_cache.get(key_hash)
+    if api_key is None:
+        result = await db.execute(_API_KEY_STMT, {"key_hash": key_hash})
+        api_key = result.scalar_one_or_none()
+        if api_key is not None:
+            db.expunge(api_key)
+            _api_key_cache[key_hash] = api_key
 
     # Timing-safe comparison to prevent timing side-channel attacks
     if api_key is None or not hmac.compare_digest(api_key.key_hash, key_hash):
@@ -80,13 +186,13 @@ async def verify_site_key(
     Used for public endpoints where the site_key comes from the
     request body or query parameters.
     """
-    stmt = (
-        select(Site)
-        .where(Site.site_key == site_key)
-        .where(Site.is_active.is_(True))
-    )
-    result = await db.execute(stmt)
-    site = result.scalar_one_or_none()
+    site = _site_cache.get(site_key)
+    if site is None:
+        result = await db.execute(_SITE_STMT, {"site_key": site_key})
+        site = result.scalar_one_or_none()
+        if site is not None:
+            db.expunge(site)
+            _site_cache[site_key] = site
 
     if site is None:
         raise HTTPException(
@@ -95,3 +201,13 @@ async def verify_site_key(
         )
 
     return site
+
+
+def clear_auth_cache() -> None:
+    """Drop all cached API key and site lookups.
+
+    Call after deactivating keys or changing a site so the next request
+    re-reads the database instead of waiting for the TTL to expire.
+    """
+    _api_key_cache.clear()
+    _site_cache.clear()
@@ -3,13 +3,17 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from canarai import __version__
 from canarai.config import get_settings
-from canarai.db.engine import dispose_engine, init_db
+from canarai.db.engine import dispose_engine, init_db, warmup_db
+from canarai.middleware import CanaraiMiddleware
+from canarai.responses import ORJSONResponse
 from canarai.routers import config, feed, health, ingest, results, sites, webhooks
+from canarai.services.alerting import close_http_client
+from canarai.services.webhook_queue import start_webhook_workers, stop_webhook_workers
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,9 @@ async def lifespan(app: FastAPI):
         level=logging.DEBUG if settings.environment == "development" else logging.INFO,
         format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
+    # Keep SQL statement logging off the hot path unless explicitly requested
+    if not settings.db_echo:
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     logger.info("Starting canar.ai API v%s in %s mode", __version__, settings.environment)
 
     # Reject insecure default secrets in production
@@ -33,9 +40,17 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database tables created/verified")
 
+    # Open the pool before serving so the first request is not a cold start
+    await warmup_db()
+
+    # Webhook deliveries run on a worker pool, off the request path
+    start_webhook_workers()
+
     yield
 
     # Shutdown
+    await stop_webhook_workers()
+    await close_http_client()
     await dispose_engine()
     logger.info("canar.ai API shut down")
 
@@ -57,42 +72,20 @@ def create_app() -> FastAPI:
         docs_url=docs_url,
         redoc_url=redoc_url,
         openapi_url=openapi_url,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware - credentials disabled since the script sends credentials: 'omit'
-    origins = [o.strip() for o in settings.cors_origins.split(",")]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins,
+        allow_origins=settings.cors_origin_list,
         allow_credentials=False,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
-    # Middleware: rewrite text/plain to application/json for /v1/ingest
-    # The canary script sends text/plain to avoid CORS preflight requests
-    @app.middleware("http")
-    async def rewrite_ingest_content_type(request: Request, call_next):
-        if request.url.path == "/v1/ingest" and request.method == "POST":
-            content_type = request.headers.get("content-type", "")
-            if "text/plain" in content_type:
-                new_headers = []
-                for k, v in request.scope["headers"]:
-                    if k == b"content-type":
-                        new_headers.append((k, b"application/json"))
-                    else:
-                        new_headers.append((k, v))
-                request.scope["headers"] = new_headers
-        return await call_next(request)
-
-    # Security headers middleware
-    @app.middleware("http")
-    async def add_security_headers(request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Cache-Control"] = "no-store"
-        return response
+    # Ingest content-type rewrite + security headers, as a single ASGI middleware
+    app.add_middleware(CanaraiMiddleware)
 
     # Include routers
     app.include_router(health.router)
@@ -0,0 +1,56 @@
+"""Pure ASGI middleware for request/response header handling."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_INGEST_PATH = "/v1/ingest"
+_CT_KEY = b"content-type"
+_TEXT_PLAIN = b"text/plain"
+_JSON = b"application/json"
+
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"cache-control", b"no-store"),
+)
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in _SECURITY_HEADERS)
+
+
+class CanaraiMiddleware:
+    """Rewrite the ingest content-type and add security headers.
+
+    The canary script sends text/plain to /v1/ingest to avoid CORS
+    preflight requests, so that header is rewritten to application/json
+    before routing. Every HTTP response gets the security headers.
+    Implemented at the ASGI level to avoid BaseHTTPMiddleware's per-request
+    task and stream overhead.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "POST" and scope["path"] == _INGEST_PATH:
+            headers = scope["headers"]
+            for i, (k, v) in enumerate(headers):
+                if k == _CT_KEY:
+                    if _TEXT_PLAIN in v:
+                        if not isinstance(headers, list):
+                            headers = scope["headers"] = list(headers)
+                        headers[i] = (_CT_KEY, _JSON)
+                    break
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Replace, not duplicate, any header the route already set
+                headers = [
+                    h for h in message.get("headers") or () if h[0] not in _SECURITY_HEADER_NAMES
+                ]
+                headers.extend(_SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -7,7 +7,7 @@ from canarai.models.visit import Visit
 from canarai.models.test_result import TestResult
 from canarai.models.webhook import Webhook, WebhookDelivery
 
-__all__ = [
+__all__ = (
     "Base",
     "Site",
     "ApiKey",
@@ -15,4 +15,4 @@ __all__ = [
     "TestResult",
     "Webhook",
     "WebhookDelivery",
-]
+)
@@ -1,24 +1,24 @@
 """API key model - authentication keys for site management."""
 
-import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, LargeBinary, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from canarai.models.base import Base
+from canarai.models.base import Base, new_id, utcnow
 
 
 class ApiKey(Base):
     __tablename__ = "api_keys"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=new_id
     )
     site_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("sites.id", ondelete="CASCADE"), nullable=False
     )
-    key_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    # Raw 32-byte SHA-256 digest
+    key_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     prefix: Mapped[str] = mapped_column(String(16), nullable=False)
     environment: Mapped[str] = mapped_column(
         String(10), nullable=False, default="live"
@@ -26,9 +26,19 @@ class ApiKey(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        default=utcnow,
         nullable=False,
     )
 
     # Relationships
     site: Mapped["Site"] = relationship(back_populates="api_keys")  # noqa: F821
+
+    __table_args__ = (
+        # Partial index: auth lookups only ever match active keys
+        Index(
+            "ix_api_keys_key_hash_active",
+            "key_hash",
+            postgresql_where=text("is_active IS true"),
+            sqlite_where=text("is_active IS 1"),
+        ),
+    )
@@ -1,8 +1,42 @@
 """Declarative base for all ORM models."""
 
+import os
+import time
+import uuid
+from datetime import UTC, datetime
+
 from sqlalchemy.orm import DeclarativeBase
 
 
+def utcnow() -> datetime:
+    """Return the current UTC time. Shared column default for timestamps."""
+    return datetime.now(UTC)
+
+
+def new_id() -> str:
+    """Return a random UUID4 as 32 hex chars. Default primary key."""
+    return uuid.uuid4().hex
+
+
+def new_ordered_id() -> str:
+    """Return a time-ordered UUIDv7 as 32 hex chars.
+
+    Used for write-heavy tables so new rows land at the right edge of the
+    primary key index instead of at random positions. ``uuid.uuid7`` only
+    exists from Python 3.14, so the fields are packed by hand.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)
+    )
+    return f"{value:032x}"
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy ORM models."""
 
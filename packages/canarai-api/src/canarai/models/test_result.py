@@ -1,12 +1,11 @@
 """Test result model - individual canary test outcomes per visit."""
 
-import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from canarai.models.base import Base
+from canarai.models.base import Base, new_ordered_id, utcnow
 from canarai.db.types import JSONType
 
 
@@ -14,7 +13,7 @@ class TestResult(Base):
     __tablename__ = "test_results"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=new_ordered_id
     )
     visit_id: Mapped[str] = mapped_column(
         String(64),
@@ -35,7 +34,7 @@ class TestResult(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        default=utcnow,
         nullable=False,
     )
 
@@ -45,5 +44,7 @@ class TestResult(Base):
     __table_args__ = (
         Index("ix_test_results_test_id", "test_id"),
         Index("ix_test_results_outcome", "outcome"),
-        Index("ix_test_results_visit_id", "visit_id"),
+        # Leads with visit_id for joins; outcome and score make the summary's
+        # per-outcome aggregation index-only
+        Index("ix_test_results_visit_id_outcome_score", "visit_id", "outcome", "score"),
     )
@@ -1,12 +1,11 @@
 """Visit model - records each page visit with detection signals."""
 
-import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from canarai.models.base import Base
+from canarai.models.base import Base, new_ordered_id, utcnow
 from canarai.db.types import JSONType
 
 
@@ -14,7 +13,7 @@ class Visit(Base):
     __tablename__ = "visits"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=new_ordered_id
     )
     visit_id: Mapped[str] = mapped_column(
         String(64), unique=True, nullable=False, index=True
@@ -35,7 +34,7 @@ class Visit(Base):
     ip_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        default=utcnow,
         nullable=False,
     )
 
@@ -46,6 +45,13 @@ class Visit(Base):
     )
 
     __table_args__ = (
-        Index("ix_visits_site_id_timestamp", "site_id", "timestamp"),
+        # Covers the results summary on PostgreSQL: its filtered-visits CTE
+        # reads only the included columns, so it is an index-only scan
+        Index(
+            "ix_visits_site_id_timestamp",
+            "site_id",
+            "timestamp",
+            postgresql_include=["visit_id", "classification", "agent_family"],
+        ),
         Index("ix_visits_classification", "classification"),
     )
@@ -1,12 +1,20 @@
 """Webhook models - outgoing webhook registration and delivery tracking."""
 
-import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from canarai.models.base import Base
+from canarai.models.base import Base, new_id, new_ordered_id, utcnow
 from canarai.db.types import JSONType
 
 
@@ -14,7 +22,7 @@ class Webhook(Base):
     __tablename__ = "webhooks"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=new_id
     )
     site_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("sites.id", ondelete="CASCADE"), nullable=False
@@ -29,7 +37,7 @@ class Webhook(Base):
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        default=utcnow,
         nullable=False,
     )
 
@@ -39,14 +47,27 @@ class Webhook(Base):
         back_populates="webhook", cascade="all, delete-orphan"
     )
 
-    __table_args__ = (Index("ix_webhooks_site_id", "site_id"),)
+    __table_args__ = (
+        Index("ix_webhooks_site_id", "site_id"),
+        # Partial index: event dispatch only ever reads enabled webhooks
+        Index(
+            "ix_webhooks_site_id_enabled",
+            "site_id",
+            postgresql_where=text("enabled IS true"),
+            sqlite_where=text("enabled IS 1"),
+        ),
+        # Serves the JSONB ?| event filter; SQLite filters events in Python
+        Index("ix_webhooks_events_gin", "events", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
 
 class WebhookDelivery(Base):
     __tablename__ = "webhook_deliveries"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=new_ordered_id
     )
     webhook_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("webhooks.id", ondelete="CASCADE"), nullable=False
@@ -60,7 +81,7 @@ class WebhookDelivery(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        default=utcnow,
         nullable=False,
     )
 
@@ -0,0 +1,20 @@
+"""Response classes shared across routers."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Handles datetimes and UUIDs natively and encodes straight to bytes.
+    UTC datetimes are written with a ``Z`` suffix, matching Pydantic's
+    JSON output, so responses look the same whichever path built them.
+    Defined locally rather than using ``fastapi.responses.ORJSONResponse``,
+    which newer FastAPI releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
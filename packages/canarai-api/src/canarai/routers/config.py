@@ -1,10 +1,13 @@
 """Config endpoint - returns site configuration to the canary script."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from canarai.config import get_settings
 from canarai.dependencies import get_db, verify_site_key
+from canarai.responses import ORJSONResponse
 from canarai.schemas.config import ConfigResponse, TestConfig
 
 router = APIRouter(prefix="/v1", tags=["config"])
@@ -32,15 +35,45 @@ DEFAULT_TESTS: dict[str, TestConfig] = {
 }
 
 
+@lru_cache(maxsize=512)
+def _build_tests(
+    enabled_test_ids: tuple[str, ...], delivery_methods: tuple[str, ...]
+) -> tuple[TestConfig, ...]:
+    """Build the test list for a site's enabled tests and delivery methods.
+
+    Sites share a handful of distinct configs, so the result is memoized
+    on the (immutable) inputs rather than rebuilt on every request.
+    """
+    tests = []
+    for test_id in enabled_test_ids:
+        if test_id in DEFAULT_TESTS:
+            test_config = DEFAULT_TESTS[test_id]
+            # Filter delivery methods to those enabled for the site
+            filtered_methods = [
+                m for m in test_config.delivery_methods if m in delivery_methods
+            ]
+            tests.append(
+                TestConfig(
+                    test_id=test_config.test_id,
+                    version=test_config.version,
+                    delivery_methods=filtered_methods or test_config.delivery_methods,
+                    payload_template=test_config.payload_template,
+                )
+            )
+    return tuple(tests)
+
+
 @router.get("/config/{site_key}", response_model=ConfigResponse)
 async def get_config(
     site_key: str,
     db: AsyncSession = Depends(get_db),
-) -> ConfigResponse:
+) -> ORJSONResponse:
     """Return the active configuration for a site.
 
     Called by the canary script on initialization to know which tests
-    to run and how to deliver them.
+    to run and how to deliver them. The response is returned directly so
+    FastAPI skips re-validating it and walking it through jsonable_encoder;
+    ``response_model`` is kept for the OpenAPI schema.
     """
     site = await verify_site_key(site_key, db)
     settings = get_settings()
@@ -54,29 +87,14 @@ async def get_config(
     )
     detection_threshold = site_config.get("detection_threshold", 0.5)
 
-    # Build test list from enabled IDs
-    tests = []
-    for test_id in enabled_test_ids:
-        if test_id in DEFAULT_TESTS:
-            test_config = DEFAULT_TESTS[test_id]
-            # Filter delivery methods to those enabled for the site
-            filtered_methods = [
-                m for m in test_config.delivery_methods if m in delivery_methods
-            ]
-            tests.append(
-                TestConfig(
-                    test_id=test_config.test_id,
-                    version=test_config.version,
-                    delivery_methods=filtered_methods or test_config.delivery_methods,
-                    payload_template=test_config.payload_template,
-                )
-            )
+    tests = _build_tests(tuple(enabled_test_ids), tuple(delivery_methods))
 
-    return ConfigResponse(
+    config = ConfigResponse(
         site_key=site.site_key,
         enabled=site.is_active,
         detection_threshold=detection_threshold,
-        tests=tests,
+        tests=list(tests),
         delivery_methods=delivery_methods,
         ingest_url=f"{settings.script_base_url}/v1/ingest",
     )
+    return ORJSONResponse(config.model_dump(mode="json"))
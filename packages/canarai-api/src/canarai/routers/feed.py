@@ -2,87 +2,110 @@
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter(prefix="/v1/feed", tags=["feed"])
 
+FEED_VERSION = "0.1.0"
 
-@router.get("/agents")
-async def get_agent_feed() -> dict:
-    """Hosted intelligence feed of known AI agent behaviors.
+# Everything but ``generated_at`` is static, so each payload is serialized
+# once at import and the timestamp is spliced in per request.
+_PREFIX = b'{"version":"' + FEED_VERSION.encode() + b'","generated_at":"'
 
-    Returns curated data about known agent families, their capabilities,
-    and observed prompt injection susceptibility.
-    """
-    return {
-        "version": "0.1.0",
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "agents": [
-            {
-                "family": "openai",
-                "variants": ["GPTBot", "ChatGPT-User", "OAI-SearchBot"],
-                "category": "llm_crawler",
-                "known_behaviors": {
-                    "respects_robots_txt": True,
-                    "executes_javascript": False,
-                    "follows_meta_directives": True,
+_AGENTS_SUFFIX = (
+    b'",'
+    + orjson.dumps(
+        {
+            "agents": [
+                {
+                    "family": "openai",
+                    "variants": ["GPTBot", "ChatGPT-User", "OAI-SearchBot"],
+                    "category": "llm_crawler",
+                    "known_behaviors": {
+                        "respects_robots_txt": True,
+                        "executes_javascript": False,
+                        "follows_meta_directives": True,
+                    },
+                    "risk_level": "high",
                 },
-                "risk_level": "high",
-            },
-            {
-                "family": "anthropic",
-                "variants": ["ClaudeBot", "Claude-Web"],
-                "category": "llm_crawler",
-                "known_behaviors": {
-                    "respects_robots_txt": True,
-                    "executes_javascript": False,
-                    "follows_meta_directives": True,
+                {
+                    "family": "anthropic",
+                    "variants": ["ClaudeBot", "Claude-Web"],
+                    "category": "llm_crawler",
+                    "known_behaviors": {
+                        "respects_robots_txt": True,
+                        "executes_javascript": False,
+                        "follows_meta_directives": True,
+                    },
+                    "risk_level": "medium",
                 },
-                "risk_level": "medium",
-            },
-            {
-                "family": "google",
-                "variants": ["Google-Extended", "Googlebot"],
-                "category": "search_crawler",
-                "known_behaviors": {
-                    "respects_robots_txt": True,
-                    "executes_javascript": True,
-                    "follows_meta_directives": True,
+                {
+                    "family": "google",
+                    "variants": ["Google-Extended", "Googlebot"],
+                    "category": "search_crawler",
+                    "known_behaviors": {
+                        "respects_robots_txt": True,
+                        "executes_javascript": True,
+                        "follows_meta_directives": True,
+                    },
+                    "risk_level": "medium",
                 },
-                "risk_level": "medium",
-            },
-            {
-                "family": "perplexity",
-                "variants": ["PerplexityBot"],
-                "category": "ai_search",
-                "known_behaviors": {
-                    "respects_robots_txt": False,
-                    "executes_javascript": False,
-                    "follows_meta_directives": False,
+                {
+                    "family": "perplexity",
+                    "variants": ["PerplexityBot"],
+                    "category": "ai_search",
+                    "known_behaviors": {
+                        "respects_robots_txt": False,
+                        "executes_javascript": False,
+                        "follows_meta_directives": False,
+                    },
+                    "risk_level": "high",
                 },
-                "risk_level": "high",
+            ],
+        }
+    )[1:]
+)
+
+_TRENDS_SUFFIX = (
+    b'",'
+    + orjson.dumps(
+        {
+            "period": "last_30_days",
+            "trends": {
+                "total_agent_visits": 0,
+                "unique_agent_families": 0,
+                "average_resilience_score": 0.0,
+                "critical_failure_rate": 0.0,
+                "most_common_agent": None,
+                "most_vulnerable_test": None,
             },
-        ],
-    }
+            "note": "Trend data will be populated as monitoring data accumulates.",
+        }
+    )[1:]
+)
+
+
+def _render(suffix: bytes) -> Response:
+    """Build a feed response stamped with the current time."""
+    generated_at = datetime.now(timezone.utc).isoformat().encode()
+    return Response(_PREFIX + generated_at + suffix, media_type="application/json")
+
+
+@router.get("/agents")
+async def get_agent_feed() -> Response:
+    """Hosted intelligence feed of known AI agent behaviors.
+
+    Returns curated data about known agent families, their capabilities,
+    and observed prompt injection susceptibility.
+    """
+    return _render(_AGENTS_SUFFIX)
 
 
 @router.get("/trends")
-async def get_trends() -> dict:
+async def get_trends() -> Response:
     """Trend data for AI agent activity across all monitored sites.
 
     Returns aggregated, anonymized trend data.
     """
-    return {
-        "version": "0.1.0",
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "period": "last_30_days",
-        "trends": {
-            "total_agent_visits": 0,
-            "unique_agent_families": 0,
-            "average_resilience_score": 0.0,
-            "critical_failure_rate": 0.0,
-            "most_common_agent": None,
-            "most_vulnerable_test": None,
-        },
-        "note": "Trend data will be populated as monitoring data accumulates.",
-    }
+    return _render(_TRENDS_SUFFIX)
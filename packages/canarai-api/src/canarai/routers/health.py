@@ -1,16 +1,47 @@
-"""Health check endpoint."""
+"""Health check endpoints."""
 
-from fastapi import APIRouter
+import logging
+
+import orjson
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from canarai import __version__
+from canarai.db.engine import ping
+from canarai.dependencies import get_db
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["health"])
 
+# Probes hit these endpoints constantly and there are only a few possible
+# bodies, so all of them are serialized once at import.
+_LIVE_BODY = orjson.dumps({"status": "ok", "version": __version__})
+_READY_BODY = orjson.dumps({"status": "ok", "version": __version__, "database": "ok"})
+_NOT_READY_BODY = orjson.dumps(
+    {"status": "degraded", "version": __version__, "database": "unavailable"}
+)
+
 
 @router.get("/health")
-async def health_check() -> dict:
-    """Return API health status and version."""
-    return {
-        "status": "ok",
-        "version": __version__,
-    }
+async def health_check() -> Response:
+    """Return API liveness and version without touching the database.
+
+    Safe for liveness probes: a database outage does not fail it.
+    """
+    return Response(_LIVE_BODY, media_type="application/json")
+
+
+@router.get("/health/ready")
+async def readiness_check(db: AsyncSession = Depends(get_db)) -> Response:
+    """Return readiness, version, and database reachability."""
+    try:
+        await ping(db)
+    except Exception:
+        logger.exception("Readiness check database ping failed")
+        return Response(
+            _NOT_READY_BODY,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            media_type="application/json",
+        )
+    return Response(_READY_BODY, media_type="application/json")
@@ -2,18 +2,28 @@
 
 import logging
 from datetime import datetime, timezone
+from functools import partial
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Header, Request, status
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from canarai.dependencies import get_db, verify_site_key
+from canarai.dependencies import (
+    get_db,
+    json_body_openapi,
+    validate_json_body,
+    verify_site_key,
+)
 from canarai.models.site import Site
 from canarai.models.test_result import TestResult
 from canarai.models.visit import Visit
-from canarai.schemas.ingest import IngestPayload, IngestResponse
-from canarai.services.alerting import fire_webhooks_for_event
+from canarai.models.webhook import Webhook
+from canarai.responses import ORJSONResponse
+from canarai.schemas.ingest import INGEST_PAYLOAD_ADAPTER, IngestResponse
+from canarai.services.alerting import fire_webhooks_for_event, get_webhooks_for_site
 from canarai.services.detection import classify_visit, hash_ip
-from canarai.services.scoring import score_outcome
+from canarai.services.scoring import OUTCOME_SCORES
+from canarai.services.webhook_queue import submit_webhook_job, webhook_workers_running
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +31,7 @@ router = APIRouter(prefix="/v1", tags=["ingest"])
 
 
 async def fire_webhooks_background(
-    site_id: str,
+    webhooks: list[Webhook],
     classification: str,
     agent_family: str | None,
     visit_id: str,
@@ -30,19 +40,25 @@ async def fire_webhooks_background(
     has_critical_failure: bool,
     exfiltration_test_ids: list[str],
 ) -> None:
-    """Dispatch webhooks in the background after the response has been sent."""
+    """Dispatch webhooks off the request path.
+
+    ``webhooks`` were loaded by the request, so this session is only
+    opened to record the delivery attempts.
+    """
     from canarai.db.engine import get_session
 
+    now_iso = datetime.now(timezone.utc).isoformat()
+
     async for db in get_session():
         try:
             if classification in ("confirmed_agent", "likely_agent"):
                 await fire_webhooks_for_event(
                     db,
-                    site_id,
+                    webhooks,
                     "visit.agent_detected",
                     {
                         "event": "visit.agent_detected",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": now_iso,
                         "data": {
                             "visit_id": visit_id,
                             "classification": classification,
@@ -56,11 +72,11 @@ async def fire_webhooks_background(
             if has_critical_failure:
                 await fire_webhooks_for_event(
                     db,
-                    site_id,
+                    webhooks,
                     "test.critical_failure",
                     {
                         "event": "test.critical_failure",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": now_iso,
                         "data": {
                             "visit_id": visit_id,
                             "classification": classification,
@@ -81,17 +97,24 @@ async def fire_webhooks_background(
     "/ingest",
     response_model=IngestResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=json_body_openapi(INGEST_PAYLOAD_ADAPTER),
 )
 async def ingest(
-    payload: IngestPayload,
     request: Request,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-) -> IngestResponse:
+) -> ORJSONResponse:
     """Receive detection and test result data from the canary script.
 
-    This is the hot path - called on every monitored page visit.
+    This is the hot path - called on every monitored page visit. The
+    three-field body is returned as a plain dict so no response model is
+    built or validated; ``response_model`` only documents it.
+
+    The body is read as raw bytes and parsed and validated in one pass by
+    pydantic-core, skipping Starlette's separate JSON decode.
     """
+    payload = await validate_json_body(request, INGEST_PAYLOAD_ADAPTER)
+
     # 1. Validate site_key
     site = await verify_site_key(payload.site_key, db)
 
@@ -100,70 +123,81 @@ async def ingest(
     client_ip = request.client.host if request.client else None
     ip_hashed = hash_ip(client_ip) if client_ip else None
 
-    headers_dict = dict(request.headers)
-
     # 3. Server-side classification
     classification, agent_family, confidence = classify_visit(
         client_detection=payload.detection,
         user_agent=user_agent,
-        headers=headers_dict,
+        headers=request.headers,
         ip=client_ip,
     )
 
-    # 4. Create Visit record
-    visit = Visit(
-        visit_id=payload.visit_id,
-        site_id=site.id,
-        page_url=payload.page_url,
-        timestamp=datetime.fromisoformat(payload.timestamp),
-        user_agent=user_agent,
-        detection={
-            "client": payload.detection.model_dump(),
-            "server_confidence": confidence,
-        },
-        classification=classification,
-        agent_family=agent_family,
-        ip_hash=ip_hashed,
+    # 4. Insert the Visit row
+    await db.execute(
+        insert(Visit).values(
+            visit_id=payload.visit_id,
+            site_id=site.id,
+            page_url=payload.page_url,
+            timestamp=payload.timestamp,
+            user_agent=user_agent,
+            detection={
+                "client": payload.detection.model_dump(),
+                "server_confidence": confidence,
+            },
+            classification=classification,
+            agent_family=agent_family,
+            ip_hash=ip_hashed,
+        )
     )
-    db.add(visit)
 
-    # 5. Create TestResult records with scores
-    results_recorded = 0
+    # 5. Insert TestResult rows with scores in a single executemany, noting
+    # exfiltration attempts for the webhook payload in the same pass
     has_critical_failure = False
+    exfiltration_test_ids = []
+    rows = []
 
     for tr in payload.test_results:
-        outcome_score = score_outcome(tr.outcome)
-
-        test_result = TestResult(
-            visit_id=payload.visit_id,
-            test_id=tr.test_id,
-            test_version=tr.test_version,
-            delivery_method=tr.delivery_method,
-            outcome=tr.outcome,
-            score=outcome_score,
-            evidence=tr.evidence,
-            injected_at=tr.injected_at,
-            observed_at=tr.observed_at,
+        rows.append(
+            {
+                "visit_id": payload.visit_id,
+                "test_id": tr.test_id,
+                "test_version": tr.test_version,
+                "delivery_method": tr.delivery_method,
+                "outcome": tr.outcome,
+                # outcome is a validated Literal, so the lookup cannot miss
+                "score": OUTCOME_SCORES[tr.outcome],
+                "evidence": tr.evidence,
+                "injected_at": tr.injected_at,
+                "observed_at": tr.observed_at,
+            }
         )
-        db.add(test_result)
-        results_recorded += 1
 
         if tr.outcome == "exfiltration_attempted":
             has_critical_failure = True
+            exfiltration_test_ids.append(tr.test_id)
+
+    results_recorded = len(rows)
+    if rows:
+        await db.execute(insert(TestResult), rows)
+
+    # 6. Load subscribed webhooks in this session if thresholds are met, so
+    # sites without webhooks never schedule a background task
+    event_types = []
+    if classification in ("confirmed_agent", "likely_agent"):
+        event_types.append("visit.agent_detected")
+    if has_critical_failure:
+        event_types.append("test.critical_failure")
+    webhooks = (
+        await get_webhooks_for_site(db, site.id, event_types) if event_types else []
+    )
+
+    # Commit so records are persisted before webhook dispatch
+    await db.commit()
 
-    # Flush to ensure records are persisted before webhook dispatch
-    await db.flush()
-
-    # 6. Fire webhooks in background (non-blocking) if thresholds are met
-    if classification in ("confirmed_agent", "likely_agent") or has_critical_failure:
-        exfiltration_test_ids = [
-            tr.test_id
-            for tr in payload.test_results
-            if tr.outcome == "exfiltration_attempted"
-        ]
-        background_tasks.add_task(
+    # 7. Fire webhooks on the worker pool (non-blocking)
+    if webhooks:
+        job = partial(
             fire_webhooks_background,
-            site_id=site.id,
+            webhooks=webhooks,
             classification=classification,
             agent_family=agent_family,
             visit_id=payload.visit_id,
@@ -172,9 +206,18 @@ async def ingest(
             has_critical_failure=has_critical_failure,
             exfiltration_test_ids=exfiltration_test_ids,
         )
-
-    return IngestResponse(
-        status="accepted",
-        visit_id=payload.visit_id,
-        results_recorded=results_recorded,
+        if webhook_workers_running():
+            submit_webhook_job(job)
+        else:
+            # No worker pool (app driven without its lifespan): run the
+            # dispatch after the response instead
+            background_tasks.add_task(job)
+
+    return ORJSONResponse(
+        {
+            "status": "accepted",
+            "visit_id": payload.visit_id,
+            "results_recorded": results_recorded,
+        },
+        status_code=status.HTTP_202_ACCEPTED,
     )
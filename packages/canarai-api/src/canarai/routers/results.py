@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import Integer, String, func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -11,20 +11,49 @@ from canarai.dependencies import get_db, verify_api_key
 from canarai.models.api_key import ApiKey
 from canarai.models.test_result import TestResult
 from canarai.models.visit import Visit
+from canarai.responses import ORJSONResponse
 from canarai.schemas.results import (
     ResultsSummary,
-    TestResultResponse,
     VisitWithResults,
 )
-from canarai.services.scoring import (
-    aggregate_outcome_counts,
-    calculate_critical_failure_rate,
-    calculate_resilience_score,
-)
+from canarai.services.scoring import OUTCOME_SCORES, summarize_outcome_counts
 
 router = APIRouter(prefix="/v1/results", tags=["results"])
 
 
+def _test_result_to_dict(tr: TestResult) -> dict:
+    """Serialize a test result row to the TestResultResponse shape."""
+    return {
+        "id": tr.id,
+        "visit_id": tr.visit_id,
+        "test_id": tr.test_id,
+        "test_version": tr.test_version,
+        "delivery_method": tr.delivery_method,
+        "outcome": tr.outcome,
+        "score": tr.score,
+        "evidence": tr.evidence,
+        "injected_at": tr.injected_at,
+        "observed_at": tr.observed_at,
+        "created_at": tr.created_at,
+    }
+
+
+def _visit_to_dict(v: Visit) -> dict:
+    """Serialize a visit and its loaded test results to the VisitWithResults shape."""
+    return {
+        "id": v.id,
+        "visit_id": v.visit_id,
+        "site_id": v.site_id,
+        "page_url": v.page_url,
+        "timestamp": v.timestamp,
+        "user_agent": v.user_agent,
+        "classification": v.classification,
+        "agent_family": v.agent_family,
+        "test_results": [_test_result_to_dict(tr) for tr in v.test_results],
+        "created_at": v.created_at,
+    }
+
+
 @router.get("", response_model=list[VisitWithResults])
 async def get_results(
     api_key: ApiKey = Depends(verify_api_key),
@@ -37,8 +66,13 @@ async def get_results(
     date_to: datetime | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-) -> list[VisitWithResults]:
-    """Query visits and their test results with optional filters."""
+) -> ORJSONResponse:
+    """Query visits and their test results with optional filters.
+
+    Rows are serialized straight from the ORM objects by orjson, which
+    formats datetimes natively, instead of building a Pydantic model per
+    visit and per test result.
+    """
     # Enforce tenant scoping: reject cross-tenant access attempts
     if site_id and site_id != api_key.site_id:
         raise HTTPException(
@@ -74,23 +108,7 @@ async def get_results(
     result = await db.execute(stmt)
     visits = result.unique().scalars().all()
 
-    return [
-        VisitWithResults(
-            id=v.id,
-            visit_id=v.visit_id,
-            site_id=v.site_id,
-            page_url=v.page_url,
-            timestamp=v.timestamp,
-            user_agent=v.user_agent,
-            classification=v.classification,
-            agent_family=v.agent_family,
-            test_results=[
-                TestResultResponse.model_validate(tr) for tr in v.test_results
-            ],
-            created_at=v.created_at,
-        )
-        for v in visits
-    ]
+    return ORJSONResponse([_visit_to_dict(v) for v in visits])
 
 
 @router.get("/summary", response_model=ResultsSummary)
@@ -117,52 +135,71 @@ async def get_results_summary(
     if date_to:
         visit_filter = visit_filter & (Visit.timestamp <= date_to)
 
-    # Total visits
-    total_stmt = select(func.count(Visit.id)).where(visit_filter)
-    total_result = await db.execute(total_stmt)
-    total_visits = total_result.scalar() or 0
-
-    # Agent visits (not human)
-    agent_stmt = (
-        select(func.count(Visit.id))
+    # Visit counts, per-outcome test counts and top agent families come back
+    # from one round trip: each part reads the filtered visits CTE and tags
+    # its rows with a metric name, and the parts are combined with UNION ALL
+    filtered = (
+        select(Visit.visit_id, Visit.classification, Visit.agent_family)
         .where(visit_filter)
-        .where(Visit.classification != "human")
+        .cte("filtered_visits")
     )
-    agent_result = await db.execute(agent_stmt)
-    agent_visits = agent_result.scalar() or 0
-
-    human_visits = total_visits - agent_visits
-
-    # Test results for this site
-    tr_stmt = (
-        select(TestResult)
-        .join(Visit, TestResult.visit_id == Visit.visit_id)
-        .where(visit_filter)
+    visit_part = select(
+        literal("visits").label("metric"),
+        literal(None, String).label("key"),
+        func.count().label("count"),
+        # Agent (not human) visits
+        func.count().filter(filtered.c.classification != "human").label("value"),
+    ).select_from(filtered)
+    outcome_part = (
+        select(
+            literal("outcome"),
+            TestResult.outcome,
+            func.count(),
+            func.sum(TestResult.score),
+        )
+        .join(filtered, TestResult.visit_id == filtered.c.visit_id)
+        .group_by(TestResult.outcome)
     )
-    tr_result = await db.execute(tr_stmt)
-    test_results = list(tr_result.scalars().all())
-
-    total_tests = len(test_results)
-    scores = [tr.score for tr in test_results]
-    outcomes = [tr.outcome for tr in test_results]
-
-    resilience_score = calculate_resilience_score(scores)
-    critical_failure_rate = calculate_critical_failure_rate(outcomes)
-    outcome_counts = aggregate_outcome_counts(outcomes)
-
-    # Top agent families
-    family_stmt = (
-        select(Visit.agent_family, func.count(Visit.id).label("count"))
-        .where(visit_filter)
-        .where(Visit.agent_family.isnot(None))
-        .group_by(Visit.agent_family)
-        .order_by(func.count(Visit.id).desc())
+    family_part = (
+        select(
+            literal("family").label("metric"),
+            filtered.c.agent_family.label("key"),
+            func.count().label("count"),
+            literal(None, Integer).label("value"),
+        )
+        .where(filtered.c.agent_family.isnot(None))
+        .group_by(filtered.c.agent_family)
+        .order_by(func.count().desc())
         .limit(10)
+        .subquery()
+    )
+    summary_stmt = union_all(visit_part, outcome_part, select(family_part))
+    rows = (await db.execute(summary_stmt)).all()
+
+    total_visits = agent_visits = 0
+    outcome_counts = {key: 0 for key in OUTCOME_SCORES}
+    score_total = 0
+    families = []
+    # Rows are plain tuples; unpacking avoids a named lookup per field
+    for metric, key, count, value in rows:
+        if metric == "outcome":
+            outcome_counts[key] = count
+            score_total += value or 0
+        elif metric == "family":
+            families.append((count, key))
+        else:
+            # COUNT(*) never returns NULL, even over no rows
+            total_visits, agent_visits = count, value
+
+    human_visits = total_visits - agent_visits
+    total_tests = sum(outcome_counts.values())
+    resilience_score, critical_failure_rate = summarize_outcome_counts(
+        outcome_counts, score_total
     )
-    family_result = await db.execute(family_stmt)
+    # UNION ALL does not keep the subquery's ordering
     top_families = [
-        {"family": row.agent_family, "count": row.count}
-        for row in family_result.all()
+        {"family": family, "count": count}
+        for count, family in sorted(families, reverse=True)
     ]
 
     return ResultsSummary(
@@ -1,31 +1,49 @@
 """Site management endpoints."""
 
-import hashlib
 import secrets
-import uuid
-from collections import defaultdict
-from time import time
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from canarai.dependencies import get_db, verify_api_key
+from canarai.dependencies import (
+    clear_auth_cache,
+    get_db,
+    hash_api_key,
+    json_body_openapi,
+    validate_json_body,
+    verify_api_key,
+)
 from canarai.models.api_key import ApiKey
+from canarai.models.base import new_id, utcnow
 from canarai.models.site import Site
 from canarai.schemas.site import (
-    SiteCreate,
+    SITE_CREATE_ADAPTER,
     SiteCreateResponse,
     SiteResponse,
     SiteUpdate,
 )
+from canarai.services.rate_limit import InMemoryRateLimiter
 
 router = APIRouter(prefix="/v1/sites", tags=["sites"])
 
 # In-memory rate limiter for unauthenticated site creation
-_site_creation_limits: dict[str, list[float]] = defaultdict(list)
 SITE_CREATION_LIMIT = 5
 SITE_CREATION_WINDOW = 3600  # 1 hour in seconds
+_site_creation_limiter = InMemoryRateLimiter(
+    max_requests=SITE_CREATION_LIMIT, window_seconds=SITE_CREATION_WINDOW
+)
+
+
+def _site_response(site: Site) -> SiteResponse:
+    """Build a SiteResponse from a loaded Site row without re-validating it.
+
+    The values come straight from the database, whose column types already
+    match the schema, so validation would only repeat work.
+    """
+    return SiteResponse.model_construct(
+        **{field: getattr(site, field) for field in SiteResponse.model_fields}
+    )
 
 
 def _generate_site_key(environment: str) -> str:
@@ -40,18 +58,13 @@ def _generate_api_key() -> str:
     return f"ca_sk_{secrets.token_hex(24)}"
 
 
-def _hash_key(raw_key: str) -> str:
-    """Hash an API key with SHA-256."""
-    return hashlib.sha256(raw_key.encode()).hexdigest()
-
-
 @router.post(
     "",
     response_model=SiteCreateResponse,
     status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(SITE_CREATE_ADAPTER),
 )
 async def create_site(
-    body: SiteCreate,
     request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> SiteCreateResponse:
@@ -60,28 +73,27 @@ async def create_site(
     The raw API key is returned only once in this response.
     Rate limited to 5 creations per hour per client IP.
     """
+    body = await validate_json_body(request, SITE_CREATE_ADAPTER)
+
     # Rate limit by client IP
     client_ip = request.client.host if request.client else "unknown"
-    now = time()
-    # Prune timestamps outside the window
-    _site_creation_limits[client_ip] = [
-        ts for ts in _site_creation_limits[client_ip] if now - ts < SITE_CREATION_WINDOW
-    ]
-    if len(_site_creation_limits[client_ip]) >= SITE_CREATION_LIMIT:
+    if not _site_creation_limiter.is_allowed(client_ip):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Rate limit exceeded: maximum 5 site creations per hour",
         )
-    _site_creation_limits[client_ip].append(now)
 
     site_key = _generate_site_key(body.environment)
-    site_id = str(uuid.uuid4())
+    site_id = new_id()
+    created_at = utcnow()
 
     site = Site(
         id=site_id,
         site_key=site_key,
         domain=body.domain,
         config=body.config.model_dump(),
+        created_at=created_at,
+        updated_at=created_at,
     )
     db.add(site)
 
@@ -90,18 +102,19 @@ async def create_site(
     api_key_prefix = raw_api_key[:11]  # ca_sk_XXXXX
 
     api_key = ApiKey(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         site_id=site_id,
-        key_hash=_hash_key(raw_api_key),
+        key_hash=hash_api_key(raw_api_key),
         prefix=api_key_prefix,
         environment=body.environment,
+        created_at=created_at,
     )
     db.add(api_key)
 
-    await db.flush()
+    await db.commit()
 
     return SiteCreateResponse(
-        site=SiteResponse.model_validate(site),
+        site=_site_response(site),
         api_key=raw_api_key,
         api_key_prefix=api_key_prefix,
     )
@@ -116,7 +129,7 @@ async def list_sites(
     stmt = select(Site).where(Site.id == api_key.site_id).order_by(Site.created_at.desc())
     result = await db.execute(stmt)
     sites = result.scalars().all()
-    return [SiteResponse.model_validate(s) for s in sites]
+    return [_site_response(s) for s in sites]
 
 
 @router.patch("/{site_id}", response_model=SiteResponse)
@@ -151,6 +164,7 @@ async def update_site(
     if body.is_active is not None:
         site.is_active = body.is_active
 
-    await db.flush()
+    await db.commit()
+    clear_auth_cache()
 
-    return SiteResponse.model_validate(site)
+    return _site_response(site)
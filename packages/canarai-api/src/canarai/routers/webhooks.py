@@ -1,21 +1,27 @@
 """Webhook management endpoints."""
 
 import secrets
-import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from canarai.dependencies import get_db, verify_api_key
+from canarai.dependencies import (
+    get_db,
+    json_body_openapi,
+    validate_json_body,
+    verify_api_key,
+)
 from canarai.models.api_key import ApiKey
+from canarai.models.base import new_id
 from canarai.models.webhook import Webhook
+from canarai.responses import ORJSONResponse
 from canarai.schemas.webhook import (
-    WebhookCreate,
+    WEBHOOK_CREATE_ADAPTER,
     WebhookResponse,
     WebhookTestResponse,
 )
-from canarai.services.alerting import send_test_webhook
+from canarai.services.alerting import clear_webhook_cache, send_test_webhook
 
 router = APIRouter(prefix="/v1/webhooks", tags=["webhooks"])
 
@@ -24,13 +30,16 @@ router = APIRouter(prefix="/v1/webhooks", tags=["webhooks"])
     "",
     response_model=WebhookResponse,
     status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(WEBHOOK_CREATE_ADAPTER),
 )
 async def create_webhook(
-    body: WebhookCreate,
+    request: Request,
     api_key: ApiKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
-) -> WebhookResponse:
+) -> ORJSONResponse:
     """Register a new webhook for a site."""
+    body = await validate_json_body(request, WEBHOOK_CREATE_ADAPTER)
+
     # Verify API key has access to this site
     if api_key.site_id != body.site_id:
         raise HTTPException(
@@ -39,16 +48,27 @@ async def create_webhook(
         )
 
     webhook = Webhook(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         site_id=body.site_id,
         url=body.url,
         events=body.events,
         secret=secrets.token_hex(32),
     )
     db.add(webhook)
-    await db.flush()
+    await db.commit()
+    clear_webhook_cache()
 
-    return WebhookResponse.model_validate(webhook)
+    return ORJSONResponse(
+        {
+            "id": webhook.id,
+            "site_id": webhook.site_id,
+            "url": webhook.url,
+            "events": webhook.events,
+            "enabled": webhook.enabled,
+            "created_at": webhook.created_at,
+        },
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.post("/{webhook_id}/test", response_model=WebhookTestResponse)
@@ -56,7 +76,7 @@ async def test_webhook(
     webhook_id: str,
     api_key: ApiKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
-) -> WebhookTestResponse:
+) -> ORJSONResponse:
     """Send a test payload to a webhook URL."""
     stmt = select(Webhook).where(Webhook.id == webhook_id)
     result = await db.execute(stmt)
@@ -76,8 +96,4 @@ async def test_webhook(
 
     success, status_code, error = await send_test_webhook(webhook)
 
-    return WebhookTestResponse(
-        success=success,
-        status_code=status_code,
-        error=error,
-    )
+    return ORJSONResponse({"success": success, "status_code": status_code, "error": error})
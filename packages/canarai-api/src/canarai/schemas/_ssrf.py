@@ -0,0 +1,87 @@
+"""Webhook URL validation shared by the schemas that accept one (SSRF prevention)."""
+
+import ipaddress
+import re
+from urllib.parse import urlparse
+
+_ALLOWED_SCHEMES: frozenset[str] = frozenset({"http", "https"})
+
+# Cloud metadata endpoints
+_BLOCKED_HOSTS: frozenset[str] = frozenset(
+    {"169.254.169.254", "metadata.google.internal", "100.100.100.200"}
+)
+
+# Non-public ranges, parsed once at import. Checked in addition to ipaddress's
+# is_private/is_reserved flags, whose coverage varies across Python versions
+# and misses CGNAT and benchmarking space.
+_BLOCKED_NETS_V4: tuple[ipaddress.IPv4Network, ...] = tuple(
+    ipaddress.IPv4Network(cidr)
+    for cidr in (
+        "0.0.0.0/8",  # "this" network
+        "10.0.0.0/8",  # private
+        "100.64.0.0/10",  # carrier-grade NAT
+        "127.0.0.0/8",  # loopback
+        "169.254.0.0/16",  # link-local, cloud metadata
+        "172.16.0.0/12",  # private
+        "192.0.0.0/24",  # IETF protocol assignments
+        "192.0.2.0/24",  # TEST-NET-1
+        "192.168.0.0/16",  # private
+        "198.18.0.0/15",  # benchmarking
+        "198.51.100.0/24",  # TEST-NET-2
+        "203.0.113.0/24",  # TEST-NET-3
+        "224.0.0.0/4",  # multicast
+        "240.0.0.0/4",  # reserved, broadcast
+    )
+)
+_BLOCKED_NETS_V6: tuple[ipaddress.IPv6Network, ...] = tuple(
+    ipaddress.IPv6Network(cidr)
+    for cidr in (
+        "::/96",  # unspecified, IPv4-compatible (deprecated)
+        "::1/128",  # loopback
+        "::ffff:0:0/96",  # IPv4-mapped
+        "64:ff9b::/96",  # NAT64
+        "100::/64",  # discard-only
+        "2001::/23",  # IETF protocol assignments
+        "2001:db8::/32",  # documentation
+        "fc00::/7",  # unique local
+        "fe80::/10",  # link-local
+        "ff00::/8",  # multicast
+    )
+)
+
+# Dotted-quad shape; anything else without a colon is treated as a DNS name
+_IPV4_SHAPE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+
+
+def validate_webhook_url(v: str | None) -> str | None:
+    """Block private IPs, cloud metadata endpoints, and non-HTTP schemes."""
+    if v is None:
+        return v
+    parsed = urlparse(v)
+    if parsed.scheme not in _ALLOWED_SCHEMES:
+        raise ValueError("Webhook URL must use http:// or https://")
+    hostname = parsed.hostname
+    if not hostname:
+        raise ValueError("Webhook URL must have a valid hostname")
+    # urlparse already lowercases hostname, so this also covers mixed-case input
+    if hostname in _BLOCKED_HOSTS:
+        raise ValueError("Webhook URL points to a blocked metadata endpoint")
+    # Only IP-shaped hosts are classified; plain hostnames skip ipaddress
+    if _IPV4_SHAPE.match(hostname):
+        ip = ipaddress.IPv4Address(hostname)
+        blocked_nets = _BLOCKED_NETS_V4
+    elif ":" in hostname:
+        ip = ipaddress.IPv6Address(hostname)
+        blocked_nets = _BLOCKED_NETS_V6
+    else:
+        return v
+    # Block private/internal IP addresses
+    if (
+        ip.is_private
+        or ip.is_loopback
+        or ip.is_link_local
+        or ip.is_reserved
+        or any(ip in net for net in blocked_nets)
+    ):
+        raise ValueError("Webhook URL must not point to private/internal addresses")
+    return v
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 class DetectionData(BaseModel):
@@ -20,7 +20,7 @@ class DetectionData(BaseModel):
 class TestResultData(BaseModel):
     """Individual test result from client-side execution."""
 
-    test_id: str = Field(pattern=r"^CAN-\d{4}$")
+    test_id: str = Field(json_schema_extra={"pattern": r"^CAN-\d{4}$"})
     test_version: str = "1.0"
     delivery_method: str = Field(max_length=64)
     outcome: Literal[
@@ -34,6 +34,19 @@ class TestResultData(BaseModel):
     injected_at: datetime | None = None
     observed_at: datetime | None = None
 
+    @field_validator("test_id")
+    @classmethod
+    def validate_test_id(cls, v: str) -> str:
+        """Require the CAN-NNNN format with a plain length/prefix check, not a regex."""
+        digits = v[4:]
+        if (
+            len(v) != 8
+            or not v.startswith("CAN-")
+            or not (digits.isascii() and digits.isdigit())
+        ):
+            raise ValueError("test_id must match CAN-NNNN")
+        return v
+
 
 class IngestPayload(BaseModel):
     """Payload sent by the canary script to the ingest endpoint."""
@@ -41,7 +54,7 @@ class IngestPayload(BaseModel):
     v: int = 1
     site_key: str = Field(max_length=64)
     visit_id: str = Field(min_length=1, max_length=64, pattern=r"^[a-zA-Z0-9_-]+$")
-    timestamp: str = Field(max_length=64)
+    timestamp: datetime
     page_url: str = Field(max_length=2048)
     detection: DetectionData
     test_results: list[TestResultData] = Field(default_factory=list, max_length=50)
@@ -53,3 +66,7 @@ class IngestResponse(BaseModel):
     status: str = "accepted"
     visit_id: str
     results_recorded: int
+
+
+# Built once so the ingest hot path can validate raw JSON bytes directly
+INGEST_PAYLOAD_ADAPTER = TypeAdapter(IngestPayload)
@@ -1,8 +1,9 @@
 """Schemas for site management endpoints."""
 
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class SiteConfig(BaseModel):
@@ -22,7 +23,7 @@ class SiteCreate(BaseModel):
 
     domain: str = Field(min_length=1, max_length=255)
     config: SiteConfig = Field(default_factory=SiteConfig)
-    environment: str = Field(default="live", pattern=r"^(live|test)$")
+    environment: Literal["live", "test"] = "live"
 
 
 class SiteUpdate(BaseModel):
@@ -53,3 +54,7 @@ class SiteCreateResponse(BaseModel):
     site: SiteResponse
     api_key: str
     api_key_prefix: str
+
+
+# Built once so create endpoints can validate raw JSON bytes directly
+SITE_CREATE_ADAPTER = TypeAdapter(SiteCreate)
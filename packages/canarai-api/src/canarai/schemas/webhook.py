@@ -1,10 +1,10 @@
 """Schemas for webhook management endpoints."""
 
-import ipaddress
 from datetime import datetime
-from urllib.parse import urlparse
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, field_validator
+
+from canarai.schemas._ssrf import validate_webhook_url
 
 
 class WebhookCreate(BaseModel):
@@ -20,26 +20,7 @@ class WebhookCreate(BaseModel):
     @classmethod
     def validate_webhook_url(cls, v: str) -> str:
         """Block private IPs, cloud metadata endpoints, and non-HTTP schemes (SSRF prevention)."""
-        parsed = urlparse(v)
-        if parsed.scheme not in ("https", "http"):
-            raise ValueError("Webhook URL must use http:// or https://")
-        hostname = parsed.hostname
-        if not hostname:
-            raise ValueError("Webhook URL must have a valid hostname")
-        # Block private/internal IP addresses
-        try:
-            ip = ipaddress.ip_address(hostname)
-            if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved:
-                raise ValueError("Webhook URL must not point to private/internal addresses")
-        except ValueError as e:
-            # If it's not an IP address, that's fine (it's a hostname) - re-raise other errors
-            if "does not appear to be an IPv4 or IPv6 address" not in str(e):
-                raise
-        # Block cloud metadata endpoints
-        blocked = {"169.254.169.254", "metadata.google.internal", "100.100.100.200"}
-        if hostname in blocked:
-            raise ValueError("Webhook URL points to a blocked metadata endpoint")
-        return v
+        return validate_webhook_url(v)
 
 
 class WebhookResponse(BaseModel):
@@ -76,3 +57,7 @@ class WebhookDeliveryResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+# Built once so create endpoints can validate raw JSON bytes directly
+WEBHOOK_CREATE_ADAPTER = TypeAdapter(WebhookCreate)
@@ -3,94 +3,188 @@
 Handles sending webhook payloads to registered endpoints with HMAC signing.
 """
 
+import asyncio
 import hashlib
 import hmac
-import json
+import importlib.util
 import logging
-import uuid
+from collections.abc import Collection
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import httpx
-from sqlalchemy import select
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import Text, select, type_coerce
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from canarai.config import get_settings
+from canarai.models.base import new_id, new_ordered_id
 from canarai.models.webhook import Webhook, WebhookDelivery
 
 logger = logging.getLogger(__name__)
 
+_http_client: httpx.AsyncClient | None = None
 
-def sign_payload(payload: dict, secret: str) -> str:
-    """Create HMAC-SHA256 signature for a webhook payload."""
-    body = json.dumps(payload, sort_keys=True, default=str)
-    return hmac.new(
-        secret.encode("utf-8"),
-        body.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+# Connection pool for webhook delivery. Idle connections to webhook hosts are
+# kept for reuse; HTTP/2 is negotiated when the h2 package is installed
+# (pip install canarai-api[http2]).
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=50, keepalive_expiry=30
+)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Short-lived cache of (detached) subscribed webhooks, keyed by site and events.
+# Most sites have none, so this mostly caches empty lists.
+WEBHOOK_CACHE_TTL = 30  # seconds
+_webhook_cache: TTLCache[tuple[str, tuple[str, ...]], list[Webhook]] = TTLCache(
+    maxsize=2048, ttl=WEBHOOK_CACHE_TTL
+)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Create or return the shared HTTP client used for webhook delivery.
+
+    Reusing one client keeps connections to webhook hosts alive across
+    deliveries instead of paying a new TCP/TLS handshake for each one.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=_HTTP_LIMITS,
+            timeout=get_settings().webhook_timeout_seconds,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Called on app shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def encode_payload(payload: dict) -> bytes:
+    """Serialize a webhook payload to the exact bytes that are signed and sent."""
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+
+@lru_cache(maxsize=1024)
+def _keyed_hmac(secret: str) -> hmac.HMAC:
+    """Return an HMAC-SHA256 keyed with ``secret`` and fed no data yet.
+
+    Callers ``copy()`` it, so the key schedule is computed once per secret
+    rather than on every delivery.
+    """
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """Create HMAC-SHA256 signature for an encoded webhook payload."""
+    mac = _keyed_hmac(secret).copy()
+    mac.update(body)
+    return mac.hexdigest()
+
+
+async def _post_signed(
+    webhook: Webhook, event_type: str, delivery_id: str, payload: dict
+) -> httpx.Response:
+    """Encode, sign and POST a payload to a webhook on the shared client."""
+    body = encode_payload(payload)
+    return await _get_http_client().post(
+        webhook.url,
+        content=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-Canarai-Signature": sign_payload(body, webhook.secret),
+            "X-Canarai-Event": event_type,
+            "X-Canarai-Delivery": delivery_id,
+        },
+    )
 
 
 async def get_webhooks_for_site(
-    db: AsyncSession, site_id: str, event_type: str
+    db: AsyncSession, site_id: str, event_types: Collection[str]
 ) -> list[Webhook]:
-    """Fetch all enabled webhooks for a site that are subscribed to the given event."""
+    """Fetch all enabled webhooks for a site subscribed to any of the given events.
+
+    Results are cached for ``WEBHOOK_CACHE_TTL`` seconds; call
+    ``clear_webhook_cache`` after changing a site's webhooks.
+    """
+    key = (site_id, tuple(event_types))
+    cached = _webhook_cache.get(key)
+    if cached is not None:
+        return cached
+
     stmt = (
         select(Webhook)
         .where(Webhook.site_id == site_id)
         .where(Webhook.enabled.is_(True))
     )
-    result = await db.execute(stmt)
-    webhooks = list(result.scalars().all())
+    if db.get_bind().dialect.name == "postgresql":
+        # JSONB ?| matches any of the event types, served by the GIN index
+        stmt = stmt.where(
+            type_coerce(Webhook.events, JSONB).has_any(
+                postgresql.array(list(event_types), type_=Text)
+            )
+        )
+        result = await db.execute(stmt)
+        webhooks = list(result.scalars().all())
+    else:
+        # SQLite stores events as JSON text, so filter in Python
+        result = await db.execute(stmt)
+        webhooks = [
+            w
+            for w in result.scalars().all()
+            if any(event_type in (w.events or []) for event_type in event_types)
+        ]
+    for webhook in webhooks:
+        db.expunge(webhook)
+    _webhook_cache[key] = webhooks
+    return webhooks
 
-    # Filter by event type (stored as JSON list)
-    return [w for w in webhooks if event_type in (w.events or [])]
+
+def clear_webhook_cache() -> None:
+    """Drop cached webhook lookups, e.g. after a webhook is created."""
+    _webhook_cache.clear()
 
 
 async def dispatch_webhook(
-    db: AsyncSession,
     webhook: Webhook,
     event_type: str,
     payload: dict,
 ) -> WebhookDelivery:
-    """Send a webhook payload and record the delivery attempt."""
-    settings = get_settings()
-    signature = sign_payload(payload, webhook.secret)
+    """Send a webhook payload and return the delivery attempt record.
 
+    The record is not added to a session; ``fire_webhooks_for_event`` adds
+    all of an event's deliveries once they have completed.
+    """
     delivery = WebhookDelivery(
-        id=str(uuid.uuid4()),
+        id=new_ordered_id(),
         webhook_id=webhook.id,
         event_type=event_type,
         payload=payload,
     )
 
-    headers = {
-        "Content-Type": "application/json",
-        "X-Canarai-Signature": signature,
-        "X-Canarai-Event": event_type,
-        "X-Canarai-Delivery": delivery.id,
-    }
-
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        response = await _post_signed(webhook, event_type, delivery.id, payload)
+        delivery.status_code = response.status_code
+
+        if response.status_code >= 400:
+            logger.warning(
+                "Webhook delivery %s to %s returned %d",
+                delivery.id,
                 webhook.url,
-                json=payload,
-                headers=headers,
-                timeout=settings.webhook_timeout_seconds,
+                response.status_code,
+            )
+            # Schedule retry
+            delivery.next_retry_at = datetime.now(timezone.utc) + timedelta(
+                minutes=2**delivery.attempt
             )
-            delivery.status_code = response.status_code
-
-            if response.status_code >= 400:
-                logger.warning(
-                    "Webhook delivery %s to %s returned %d",
-                    delivery.id,
-                    webhook.url,
-                    response.status_code,
-                )
-                # Schedule retry
-                delivery.next_retry_at = datetime.now(timezone.utc) + timedelta(
-                    minutes=2**delivery.attempt
-                )
 
     except httpx.TimeoutException:
         logger.error("Webhook delivery %s to %s timed out", delivery.id, webhook.url)
@@ -104,24 +198,42 @@ async def dispatch_webhook(
         delivery.status_code = None
         delivery.next_retry_at = datetime.now(timezone.utc) + timedelta(minutes=2)
 
-    db.add(delivery)
     return delivery
 
 
 async def fire_webhooks_for_event(
     db: AsyncSession,
-    site_id: str,
+    webhooks: list[Webhook],
     event_type: str,
     payload: dict,
 ) -> list[WebhookDelivery]:
-    """Find all relevant webhooks for a site/event and dispatch them."""
-    webhooks = await get_webhooks_for_site(db, site_id, event_type)
-    deliveries = []
+    """Dispatch an event concurrently to each of the given webhooks subscribed to it.
 
-    for webhook in webhooks:
-        delivery = await dispatch_webhook(db, webhook, event_type, payload)
-        deliveries.append(delivery)
+    ``webhooks`` are loaded up front by the caller (see
+    ``get_webhooks_for_site``); ``db`` is only used to record deliveries,
+    which are added after every post has finished so the session is never
+    touched by concurrent tasks.
+    """
+    results = await asyncio.gather(
+        *(
+            dispatch_webhook(webhook, event_type, payload)
+            for webhook in webhooks
+            if event_type in (webhook.events or [])
+        ),
+        return_exceptions=True,
+    )
+
+    deliveries = []
+    for result in results:
+        if isinstance(result, WebhookDelivery):
+            deliveries.append(result)
+        else:
+            logger.error(
+                "Webhook dispatch for %s failed", event_type, exc_info=result
+            )
 
+    # Nothing is flushed here; the caller's commit inserts them together
+    db.add_all(deliveries)
     return deliveries
 
 
@@ -132,7 +244,6 @@ async def send_test_webhook(
 
     Returns (success, status_code, error_message).
     """
-    settings = get_settings()
     test_payload = {
         "event": "webhook.test",
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -141,25 +252,10 @@ async def send_test_webhook(
         },
     }
 
-    signature = sign_payload(test_payload, webhook.secret)
-
-    headers = {
-        "Content-Type": "application/json",
-        "X-Canarai-Signature": signature,
-        "X-Canarai-Event": "webhook.test",
-        "X-Canarai-Delivery": str(uuid.uuid4()),
-    }
-
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                webhook.url,
-                json=test_payload,
-                headers=headers,
-                timeout=settings.webhook_timeout_seconds,
-            )
-            success = response.status_code < 400
-            return success, response.status_code, None
+        response = await _post_signed(webhook, "webhook.test", new_id(), test_payload)
+        success = response.status_code < 400
+        return success, response.status_code, None
 
     except httpx.TimeoutException:
         return False, None, "Request timed out"
@@ -5,11 +5,17 @@ information such as HTTP headers and IP analysis.
 """
 
 import hashlib
-import hmac as hmac_module
 import re
+from collections.abc import Mapping
+from functools import lru_cache
 
 from canarai.schemas.ingest import DetectionData
 
+try:
+    import hyperscan
+except ImportError:  # optional: pip install canarai-api[hyperscan]
+    hyperscan = None
+
 # Known AI agent user-agent patterns
 AGENT_UA_PATTERNS: list[tuple[str, str]] = [
     (r"GPTBot", "openai"),
@@ -30,13 +36,65 @@ AGENT_UA_PATTERNS: list[tuple[str, str]] = [
     (r"Applebot-Extended", "apple"),
 ]
 
-# Headers that suggest automated/agent traffic
-SUSPICIOUS_HEADERS = {
-    "x-openai-gptbot",
-    "x-anthropic-request",
-    "x-ai-crawler",
+# All patterns merged into one alternation so a user agent is scanned once.
+# Group names must be unique, so each pattern gets an indexed group that
+# maps back to its family.
+_UA_REGEX = re.compile(
+    "|".join(
+        f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(AGENT_UA_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+_GROUP_TO_FAMILY: dict[str, str] = {
+    f"p{i}": family for i, (_, family) in enumerate(AGENT_UA_PATTERNS)
 }
 
+
+def _compile_ua_database():
+    """Compile AGENT_UA_PATTERNS into a Hyperscan block-mode database."""
+    count = len(AGENT_UA_PATTERNS)
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode() for pattern, _ in AGENT_UA_PATTERNS],
+        ids=list(range(count)),
+        elements=count,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * count,
+    )
+    return database
+
+
+# When Hyperscan is installed, user agents are matched by its DFA engine;
+# otherwise _UA_REGEX is used.
+_UA_DATABASE = _compile_ua_database() if hyperscan is not None else None
+
+
+def _match_ua_family(user_agent: str) -> str | None:
+    """Return the family of the first agent pattern found in ``user_agent``."""
+    if _UA_DATABASE is not None:
+        matched: list[tuple[int, int]] = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched.append((start, pattern_id))
+
+        _UA_DATABASE.scan(user_agent.encode(), match_event_handler=on_match)
+        # Matches arrive in order of end offset; take the leftmost start (then
+        # the earliest pattern) so the result agrees with _UA_REGEX.search
+        return AGENT_UA_PATTERNS[min(matched)[1]][1] if matched else None
+
+    match = _UA_REGEX.search(user_agent)
+    return _GROUP_TO_FAMILY[match.lastgroup] if match else None
+
+
+# Headers that suggest automated/agent traffic
+SUSPICIOUS_HEADERS = frozenset(
+    {
+        "x-openai-gptbot",
+        "x-anthropic-request",
+        "x-ai-crawler",
+    }
+)
+
+# Documents the ladder in classify_visit; keep the two in sync
 CLASSIFICATION_THRESHOLDS = {
     "confirmed_agent": 0.85,
     "likely_agent": 0.70,
@@ -45,16 +103,48 @@ CLASSIFICATION_THRESHOLDS = {
 }
 
 
+def _blake2b_key(secret: str) -> bytes:
+    """Encode a secret as a BLAKE2b key, hashing it down if over 64 bytes."""
+    key = secret.encode()
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        key = hashlib.blake2b(key).digest()
+    return key
+
+
 def hash_ip(ip: str, secret: str | None = None) -> str:
-    """HMAC-hash an IP address for privacy-preserving storage.
+    """Keyed-hash an IP address for privacy-preserving storage.
 
-    Uses HMAC with the server secret so the hash cannot be brute-forced
-    without knowing the key (plain SHA-256 of IPv4 is trivially reversible).
+    Uses BLAKE2b keyed with the server secret so the hash cannot be
+    brute-forced without knowing the key (plain SHA-256 of IPv4 is trivially
+    reversible). Keyed BLAKE2b is a MAC in a single pass, without HMAC's
+    inner and outer hashes.
     """
     if secret is None:
         from canarai.config import get_settings
+
         secret = get_settings().api_secret_key
-    return hmac_module.new(secret.encode(), ip.encode(), hashlib.sha256).hexdigest()[:16]
+    return _hash_ip_cached(ip, secret)
+
+
+def _keyed_hash(ip: str, key: bytes) -> str:
+    """BLAKE2b-hash ``ip`` under ``key`` to 16 hex characters."""
+    return hashlib.blake2b(ip.encode(), key=key, digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=16_384)
+def _hash_ip_cached(ip: str, secret: str) -> str:
+    """Hash ``ip`` under ``secret``.
+
+    Crawlers hit many pages from the same address in quick succession, so
+    hashes are memoized per IP. The secret is part of the key, so a rotated
+    ``api_secret_key`` never returns hashes made with the old one.
+    """
+    return _keyed_hash(ip, _blake2b_key(secret))
+
+
+# Only this much of a user agent is classified. Agent tokens sit well inside
+# it, and it bounds what the cache holds for arbitrary client-supplied strings.
+_MAX_UA_LENGTH = 512
 
 
 def detect_agent_from_ua(user_agent: str | None) -> tuple[bool, str | None, float]:
@@ -64,33 +154,45 @@ def detect_agent_from_ua(user_agent: str | None) -> tuple[bool, str | None, floa
     """
     if not user_agent:
         return False, None, 0.0
+    return _detect_agent_from_ua_cached(user_agent[:_MAX_UA_LENGTH])
+
 
-    for pattern, family in AGENT_UA_PATTERNS:
-        if re.search(pattern, user_agent, re.IGNORECASE):
-            return True, family, 0.95
+@lru_cache(maxsize=2048)
+def _detect_agent_from_ua_cached(user_agent: str) -> tuple[bool, str | None, float]:
+    """Classify a truncated user agent.
+
+    Real traffic repeats a small set of user-agent strings, so results are
+    memoized per string.
+    """
+    family = _match_ua_family(user_agent)
+    if family:
+        return True, family, 0.95
 
     return False, None, 0.0
 
 
-def detect_agent_from_headers(headers: dict[str, str]) -> tuple[bool, float]:
+def detect_agent_from_headers(headers: Mapping[str, str]) -> tuple[bool, float]:
     """Check request headers for known agent indicators.
 
+    Header names are matched case-insensitively. The names are walked once,
+    setting flags, instead of running a separate lookup per header of
+    interest.
+
     Returns (is_agent, confidence_boost).
     """
-    lower_headers = {k.lower() for k in headers}
-    matches = lower_headers & SUSPICIOUS_HEADERS
-
-    if matches:
-        return True, 0.3
+    has_accept_language = False
+    has_accept = False
+    for name in headers:
+        name = name.lower()
+        if name in SUSPICIOUS_HEADERS:
+            return True, 0.3
+        if name == "accept-language":
+            has_accept_language = True
+        elif name == "accept":
+            has_accept = True
 
     # No Accept-Language or Accept headers is mildly suspicious
-    missing_human_headers = 0
-    if "accept-language" not in lower_headers:
-        missing_human_headers += 1
-    if "accept" not in lower_headers:
-        missing_human_headers += 1
-
-    if missing_human_headers == 2:
+    if not has_accept_language and not has_accept:
         return False, 0.1
 
     return False, 0.0
@@ -99,7 +201,7 @@ def detect_agent_from_headers(headers: dict[str, str]) -> tuple[bool, float]:
 def classify_visit(
     client_detection: DetectionData,
     user_agent: str | None = None,
-    headers: dict[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
     ip: str | None = None,
 ) -> tuple[str, str | None, float]:
     """Classify a visit by combining client and server-side signals.
@@ -122,11 +224,14 @@ def classify_visit(
         if header_is_agent:
             confidence = min(1.0, confidence + header_boost)
 
-    # Determine classification from confidence
-    classification = "human"
-    for label, threshold in CLASSIFICATION_THRESHOLDS.items():
-        if confidence >= threshold:
-            classification = label
-            break
+    # Determine classification from confidence (mirrors CLASSIFICATION_THRESHOLDS)
+    if confidence >= 0.85:
+        classification = "confirmed_agent"
+    elif confidence >= 0.70:
+        classification = "likely_agent"
+    elif confidence >= 0.50:
+        classification = "suspected_agent"
+    else:
+        classification = "human"
 
     return classification, agent_family, confidence
@@ -0,0 +1,49 @@
+"""In-process rate limiting for unauthenticated endpoints."""
+
+from array import array
+from time import monotonic
+
+from cachetools import TTLCache
+
+
+class _Window:
+    """Ring buffer of the last ``max_requests`` admit times for one key."""
+
+    __slots__ = ("times", "head")
+
+    def __init__(self, max_requests: int) -> None:
+        # -inf marks unused slots, which are always older than the window
+        self.times = array("d", [float("-inf")]) * max_requests
+        self.head = 0
+
+
+class InMemoryRateLimiter:
+    """Sliding-window limiter allowing ``max_requests`` per key per window.
+
+    Per-key history lives in a TTLCache whose TTL equals the window, so
+    idle keys expire on their own and the number of tracked keys is capped
+    at ``max_keys`` rather than growing with every client ever seen.
+
+    Each key keeps a fixed ring buffer of its last ``max_requests`` admit
+    times. ``head`` points at the oldest, so a request is allowed exactly
+    when that slot has left the window; no pruning is needed.
+    """
+
+    def __init__(self, max_requests: int, window_seconds: float, max_keys: int = 10_000) -> None:
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._requests: TTLCache[str, _Window] = TTLCache(maxsize=max_keys, ttl=window_seconds)
+
+    def is_allowed(self, key: str) -> bool:
+        """Record a request for ``key`` and return whether it is within the limit."""
+        now = monotonic()
+        window = self._requests.get(key)
+        if window is None:
+            window = _Window(self.max_requests)
+        # Reassign to refresh the entry's TTL
+        self._requests[key] = window
+        if window.times[window.head] > now - self.window_seconds:
+            return False
+        window.times[window.head] = now
+        window.head = (window.head + 1) % self.max_requests
+        return True
@@ -56,3 +56,18 @@ def aggregate_outcome_counts(outcomes: list[str]) -> dict[str, int]:
         else:
             counts[outcome] = counts.get(outcome, 0) + 1
     return counts
+
+
+def summarize_outcome_counts(counts: dict[str, int], score_total: int) -> tuple[float, float]:
+    """Compute (resilience_score, critical_failure_rate) from aggregated counts.
+
+    Matches calculate_resilience_score and calculate_critical_failure_rate
+    over the expanded lists, for callers that aggregate in SQL.
+    """
+    total = sum(counts.values())
+    if not total:
+        return 0.0, 0.0
+    resilience_score = round(score_total / total, 2)
+    critical_count = counts.get("exfiltration_attempted", 0)
+    critical_failure_rate = round((critical_count / total) * 100, 2)
+    return resilience_score, critical_failure_rate
@@ -0,0 +1,81 @@
+"""Bounded worker pool for webhook dispatch.
+
+Webhook delivery waits on third-party endpoints, so it runs on a small
+pool of worker tasks fed by a bounded queue instead of on the request
+that triggered it. Ingest latency then no longer depends on how slow a
+site's webhook targets are.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from canarai.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+WebhookJob = Callable[[], Awaitable[None]]
+
+_queue: asyncio.Queue[WebhookJob] | None = None
+_workers: list[asyncio.Task] = []
+
+
+async def _worker(queue: asyncio.Queue[WebhookJob]) -> None:
+    """Run queued jobs until cancelled."""
+    while True:
+        job = await queue.get()
+        try:
+            await job()
+        except Exception:
+            logger.exception("Webhook dispatch job failed")
+        finally:
+            queue.task_done()
+
+
+def start_webhook_workers() -> None:
+    """Create the job queue and spawn the worker tasks. Called on app startup."""
+    global _queue
+    if _queue is not None:
+        return
+    settings = get_settings()
+    _queue = asyncio.Queue(maxsize=settings.webhook_queue_size)
+    for _ in range(settings.webhook_workers):
+        _workers.append(asyncio.create_task(_worker(_queue)))
+
+
+def webhook_workers_running() -> bool:
+    """Return whether the worker pool has been started."""
+    return _queue is not None
+
+
+def submit_webhook_job(job: WebhookJob) -> bool:
+    """Queue a job for the worker pool without waiting.
+
+    Returns False and drops the job when the queue is full, so a backlog
+    of slow webhook targets cannot stall ingest.
+    """
+    if _queue is None:
+        raise RuntimeError("Webhook workers are not running")
+    try:
+        _queue.put_nowait(job)
+    except asyncio.QueueFull:
+        logger.warning("Webhook queue full; dropping dispatch job")
+        return False
+    return True
+
+
+async def stop_webhook_workers() -> None:
+    """Finish queued jobs and stop the workers. Called on app shutdown."""
+    global _queue
+    if _queue is None:
+        return
+    timeout = get_settings().webhook_timeout_seconds
+    try:
+        await asyncio.wait_for(_queue.join(), timeout=timeout)
+    except TimeoutError:
+        logger.warning("Webhook queue not drained within %ss; cancelling", timeout)
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    _queue = None
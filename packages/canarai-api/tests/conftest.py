@@ -57,7 +57,6 @@ async def client(db_engine) -> AsyncGenerator[AsyncClient, None]:
         async with factory() as session:
             try:
                 yield session
-                await session.commit()
             except Exception:
                 await session.rollback()
                 raise
@@ -0,0 +1,48 @@
+"""Tests for server-side agent detection."""
+
+import pytest
+from canarai.config import get_settings
+from canarai.services.detection import (
+    _detect_agent_from_ua_cached,
+    detect_agent_from_headers,
+    detect_agent_from_ua,
+    hash_ip,
+)
+
+
+@pytest.fixture
+def reset_settings():
+    """Drop cached settings before and after the test."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_hash_ip_follows_secret_rotation(monkeypatch, reset_settings):
+    """Rotating api_secret_key changes server-keyed IP hashes."""
+    monkeypatch.setenv("API_SECRET_KEY", "first-secret")
+    first = hash_ip("203.0.113.7")
+    assert first == hash_ip("203.0.113.7", "first-secret")
+
+    monkeypatch.setenv("API_SECRET_KEY", "second-secret")
+    get_settings.cache_clear()
+    second = hash_ip("203.0.113.7")
+    assert second == hash_ip("203.0.113.7", "second-secret")
+    assert second != first
+
+
+def test_detect_agent_from_ua_truncates_cache_key():
+    """Long user agents are classified on a bounded prefix."""
+    _detect_agent_from_ua_cached.cache_clear()
+    ua = "Mozilla/5.0 (compatible; GPTBot/1.0)" + "x" * 10_000
+    assert detect_agent_from_ua(ua) == (True, "openai", 0.95)
+    assert detect_agent_from_ua(ua + "y") == (True, "openai", 0.95)
+    info = _detect_agent_from_ua_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_detect_agent_from_headers_ignores_name_case():
+    """Plain dicts with mixed-case names classify like Starlette headers."""
+    assert detect_agent_from_headers({"Accept-Language": "en"}) == (False, 0.0)
+    assert detect_agent_from_headers({"X-AI-Crawler": "1"}) == (True, 0.3)
+    assert detect_agent_from_headers({"User-Agent": "curl"}) == (False, 0.1)
@@ -1,7 +1,11 @@
 """Tests for the health check endpoint."""
 
+import json
+
 import pytest
-from httpx import AsyncClient
+from canarai.dependencies import get_db
+from canarai.main import create_app
+from httpx import ASGITransport, AsyncClient
 
 
 @pytest.mark.asyncio
@@ -12,6 +16,38 @@ async def test_health_check(client: AsyncClient):
     data = response.json()
     assert data["status"] == "ok"
     assert "version" in data
+    assert "database" not in data
+
+
+@pytest.mark.asyncio
+async def test_readiness_check(client: AsyncClient):
+    """Readiness endpoint also reports database reachability."""
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ok"
+    assert data["database"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_health_is_independent_of_database():
+    """Liveness stays up while readiness reports an unreachable database."""
+
+    class DownSession:
+        async def execute(self, *args, **kwargs):
+            raise ConnectionError("database down")
+
+    async def down_db():
+        yield DownSession()
+
+    app = create_app()
+    app.dependency_overrides[get_db] = down_db
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        live = await ac.get("/health")
+        ready = await ac.get("/health/ready")
+    assert live.status_code == 200
+    assert ready.status_code == 503
+    assert ready.json()["database"] == "unavailable"
 
 
 @pytest.mark.asyncio
@@ -29,6 +65,18 @@ async def test_create_site(client: AsyncClient):
     assert data["site"]["site_key"].startswith("ca_live_")
     assert data["api_key"].startswith("ca_sk_")
 
+    # Listing returns the same site with the same fields as creation
+    list_resp = await client.get(
+        "/v1/sites",
+        headers={"Authorization": f"Bearer {data['api_key']}"},
+    )
+    assert list_resp.status_code == 200
+    sites = list_resp.json()
+    assert len(sites) == 1
+    assert sites[0].keys() == data["site"].keys()
+    assert sites[0]["id"] == data["site"]["id"]
+    assert sites[0]["config"] == data["site"]["config"]
+
 
 @pytest.mark.asyncio
 async def test_ingest_requires_valid_site_key(client: AsyncClient):
@@ -123,3 +171,93 @@ async def test_full_ingest_flow(client: AsyncClient):
     assert summary["total_tests"] == 2
     assert summary["resilience_score"] == 87.5  # (75 + 100) / 2
     assert summary["critical_failure_rate"] == 50.0  # 1 of 2
+
+
+@pytest.mark.asyncio
+async def test_deactivated_site_rejected_immediately(client: AsyncClient):
+    """Deactivating a site takes effect without waiting for the auth cache TTL."""
+    create_resp = await client.post("/v1/sites", json={"domain": "cache-test.com"})
+    site_data = create_resp.json()
+    site_id = site_data["site"]["id"]
+    site_key = site_data["site"]["site_key"]
+    api_key = site_data["api_key"]
+
+    config_resp = await client.get(f"/v1/config/{site_key}")
+    assert config_resp.status_code == 200
+
+    patch_resp = await client.patch(
+        f"/v1/sites/{site_id}",
+        json={"is_active": False},
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+    assert patch_resp.status_code == 200
+
+    config_resp = await client.get(f"/v1/config/{site_key}")
+    assert config_resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_ingest_accepts_text_plain(client: AsyncClient):
+    """The script posts text/plain to skip preflight; it is parsed as JSON."""
+    create_resp = await client.post("/v1/sites", json={"domain": "plain.com"})
+    site_key = create_resp.json()["site"]["site_key"]
+
+    body = json.dumps(
+        {
+            "v": 1,
+            "site_key": site_key,
+            "visit_id": "plain-visit-001",
+            "timestamp": "2026-02-21T12:00:00Z",
+            "page_url": "https://plain.com/",
+            "detection": {"confidence": 0.0},
+            "test_results": [],
+        }
+    )
+    response = await client.post(
+        "/v1/ingest",
+        content=body,
+        headers={"Content-Type": "text/plain;charset=UTF-8"},
+    )
+    assert response.status_code == 202
+    assert response.json()["visit_id"] == "plain-visit-001"
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+
+@pytest.mark.asyncio
+async def test_create_endpoints_require_json(client: AsyncClient):
+    """Site and webhook creation reject non-JSON "simple" cross-origin POSTs."""
+    response = await client.post(
+        "/v1/sites",
+        content=json.dumps({"domain": "simple.com"}),
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 415
+
+    create_resp = await client.post("/v1/sites", json={"domain": "hooks.com"})
+    site = create_resp.json()
+    api_key = site["api_key"]
+    response = await client.post(
+        "/v1/webhooks",
+        content=json.dumps({"site_id": site["site"]["id"], "url": "https://hooks.example.com/"}),
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "text/plain"},
+    )
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_openapi_request_bodies_resolve(client: AsyncClient):
+    """Raw-body endpoints document self-contained JSON request schemas."""
+    response = await client.get("/openapi.json")
+    assert response.status_code == 200
+    paths = response.json()["paths"]
+    for path, field in (
+        ("/v1/sites", "domain"),
+        ("/v1/webhooks", "url"),
+        ("/v1/ingest", "detection"),
+    ):
+        schema = paths[path]["post"]["requestBody"]["content"]["application/json"]["schema"]
+        assert field in schema["properties"]
+        assert "$defs" not in json.dumps(schema)
+    # Nested models are inlined rather than referenced
+    ingest = paths["/v1/ingest"]["post"]["requestBody"]["content"]["application/json"]
+    assert "confidence" in ingest["schema"]["properties"]["detection"]["properties"]
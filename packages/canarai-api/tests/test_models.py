@@ -0,0 +1,25 @@
+"""Tests for shared model helpers."""
+
+import time
+import uuid
+
+from canarai.models import base
+from canarai.models.base import new_ordered_id
+
+
+def test_new_ordered_id_is_uuid7():
+    """IDs carry the version 7 nibble and the RFC 9562 variant bits."""
+    value = uuid.UUID(hex=new_ordered_id())
+    assert value.version == 7
+    assert value.int >> 62 & 0b11 == 0b10
+
+
+def test_new_ordered_id_sorts_by_millisecond(monkeypatch):
+    """IDs generated in later milliseconds sort after earlier ones."""
+    start = time.time_ns()
+    ids = []
+    for offset_ms in range(5):
+        monkeypatch.setattr(base.time, "time_ns", lambda: start + offset_ms * 1_000_000)
+        ids.append(new_ordered_id())
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
@@ -0,0 +1,58 @@
+"""Tests for webhook URL SSRF validation."""
+
+import pytest
+from canarai.schemas._ssrf import validate_webhook_url
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        # Blocked before the explicit network lists were added
+        "http://127.0.0.1/",
+        "http://10.0.0.5/",
+        "http://172.16.0.1/",
+        "http://192.168.1.1/",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://[::1]/",
+        "http://[::127.0.0.1]/",
+        "http://[::7f00:1]/",
+        "http://[fe80::1]/",
+        "http://[fc00::1]/",
+        "http://[4000::1]/",
+        "http://metadata.google.internal/",
+        # Newly blocked ranges
+        "http://0.0.0.0/",
+        "http://100.64.0.1/",
+        "http://198.18.0.1/",
+        "http://192.0.2.1/",
+        "http://224.0.0.1/",
+        "http://[::ffff:127.0.0.1]/",
+        "http://[64:ff9b::7f00:1]/",
+        "http://[2001:db8::1]/",
+        "http://[ff02::1]/",
+    ],
+)
+def test_blocks_internal_addresses(url: str):
+    """Private, reserved and metadata addresses are rejected."""
+    with pytest.raises(ValueError):
+        validate_webhook_url(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://hooks.example.com/canarai",
+        "http://93.184.216.34/hook",
+        "https://[2606:4700::1111]/hook",
+    ],
+)
+def test_allows_public_addresses(url: str):
+    """Public hostnames and IPs pass through unchanged."""
+    assert validate_webhook_url(url) == url
+
+
+@pytest.mark.parametrize("url", ["ftp://example.com/", "http:///path", "http://999.1.1.1/"])
+def test_rejects_malformed_urls(url: str):
+    """Non-HTTP schemes, missing hosts and invalid dotted quads are rejected."""
+    with pytest.raises(ValueError):
+        validate_webhook_url(url)